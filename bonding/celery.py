@@ -1,10 +1,17 @@
 """
 Celery configuration for background tasks
+
+Workers (one per queue):
+    celery -A bonding worker -Q celery,notifications
+    celery -A bonding worker -Q gamification -Ofair --prefetch-multiplier=1 --max-tasks-per-child=100
+    celery -A bonding worker -Q maintenance -Ofair --prefetch-multiplier=1
+    celery -A bonding beat
 """
 
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 # Set default Django settings
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bonding.settings')
@@ -20,10 +27,13 @@ app.autodiscover_tasks()
 
 
 # Periodic Tasks Schedule
+# Treat this dict as frozen: never mutate it (or scheduler.schedule) at
+# runtime, so beat can reuse its heap between ticks. Add dynamic entries
+# through app.add_periodic_task() instead.
 app.conf.beat_schedule = {
     # Check and update streaks every day at midnight
     'update-streaks-daily': {
-        'task': 'apps.gamification.tasks.check_and_update_streaks',
+        'task': 'bondingapp.tasks.fanout_streak_check',
         'schedule': crontab(hour=0, minute=0),  # Every day at midnight
     },
     
@@ -41,15 +51,39 @@ app.conf.beat_schedule = {
     
     # Auto-award milestones
     'check-milestones': {
-        'task': 'apps.gamification.tasks.check_and_award_milestones',
+        'task': 'bondingapp.tasks.fanout_milestone_check',
         'schedule': crontab(hour=1, minute=0),  # Every day at 1 AM
     },
     
+    # Recount each user's last-30-days completions (bond score input)
+    'refresh-recent-completion-counts': {
+        'task': 'bondingapp.tasks.fanout_recent_completion_counts',
+        'schedule': crontab(hour=0, minute=5),  # Every day at 12:05 AM
+    },
+    
+    # Record each partnered user's bond score at the end of the day
+    'snapshot-bond-scores': {
+        'task': 'bondingapp.tasks.fanout_bond_score_snapshot',
+        'schedule': crontab(hour=23, minute=50),  # Every day at 11:50 PM
+    },
+    
     # Clean up old notifications (older than 30 days)
     'cleanup-old-notifications': {
-        'task': 'apps.notifications.tasks.cleanup_old_notifications',
+        'task': 'bondingapp.tasks.cleanup_old_notifications',
         'schedule': crontab(hour=2, minute=0, day_of_week=0),  # Every Sunday at 2 AM
     },
+    
+    # Keep the refresh-token blacklist tables to unexpired tokens only
+    'flush-expired-tokens': {
+        'task': 'bondingapp.tasks.flush_expired_tokens',
+        'schedule': crontab(hour=3, minute=0),  # Every day at 3 AM
+    },
+    
+    # Refresh denormalized admin counters (category activity / badge unlock counts)
+    'refresh-admin-counters': {
+        'task': 'bondingapp.tasks.refresh_admin_counters',
+        'schedule': crontab(minute='*/5'),  # Every 5 minutes
+    },
 }
 
 # Celery configuration
@@ -62,11 +96,44 @@ app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
-    worker_prefetch_multiplier=4,
+    # Periodic tasks are I/O-bound (DB + push providers); a low prefetch keeps
+    # one slow task from holding reserved messages other workers could run.
+    worker_prefetch_multiplier=int(os.environ.get('CELERY_PREFETCH_MULTIPLIER', '1')),
     worker_max_tasks_per_child=1000,
+    worker_disable_rate_limits=False,
+    task_acks_late=True,
+    # One queue per periodic task family keeps each worker's reserved queue
+    # short and lets -Ofair dispatch fairly within it.
+    task_routes={
+        # Nightly per-user sweeps; the gamification worker recycles its
+        # processes every 100 tasks to bound memory growth.
+        'bondingapp.tasks.fanout_streak_check': {'queue': 'gamification'},
+        'bondingapp.tasks.check_streak_chunk': {'queue': 'gamification'},
+        'bondingapp.tasks.fanout_milestone_check': {'queue': 'gamification'},
+        'bondingapp.tasks.award_milestones_chunk': {'queue': 'gamification'},
+        'bondingapp.tasks.aggregate_results': {'queue': 'gamification'},
+        'bondingapp.tasks.fanout_bond_score_snapshot': {'queue': 'gamification'},
+        'bondingapp.tasks.snapshot_bond_scores_chunk': {'queue': 'gamification'},
+        'bondingapp.tasks.fanout_recent_completion_counts': {'queue': 'gamification'},
+        'bondingapp.tasks.refresh_recent_completion_counts_chunk': {'queue': 'gamification'},
+        'bondingapp.tasks.create_notification': {'queue': 'notifications'},
+        'bondingapp.tasks.notify_from_template': {'queue': 'notifications'},
+        # Weekly cleanup is long-running; run its worker with
+        # `-Q maintenance -Ofair --prefetch-multiplier=1`
+        'bondingapp.tasks.cleanup_old_notifications': {'queue': 'maintenance'},
+        'bondingapp.tasks.refresh_admin_counters': {'queue': 'maintenance'},
+        'bondingapp.tasks.flush_expired_tokens': {'queue': 'maintenance'},
+    },
 )
 
 
+@worker_process_init.connect
+def close_inherited_db_connections(**kwargs):
+    """Give each forked worker process its own persistent DB connections"""
+    from django.db import connections
+    connections.close_all()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     """Debug task to test Celery"""
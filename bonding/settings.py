@@ -49,7 +49,6 @@ INSTALLED_APPS = [
     'corsheaders',
     'django_filters',
     'drf_spectacular',  # API documentation
-    'debug_toolbar',
     # Local apps
     'bondingapp',
     'import_export',
@@ -67,10 +66,14 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
     
 ]
 
+# Debug toolbar only in development (keeps it out of production worker startup)
+if DEBUG:
+    INSTALLED_APPS += ['debug_toolbar']
+    MIDDLEWARE += ['debug_toolbar.middleware.DebugToolbarMiddleware']
+
 ROOT_URLCONF = 'bonding.urls'
 
 TEMPLATES = [
@@ -101,7 +104,10 @@ DATABASES = {
         'NAME': BASE_DIR / 'db.sqlite3',
         'OPTIONS': {
             'timeout': 20,  # Prevent database locking issues
-        }
+        },
+        # Reuse connections across requests/tasks instead of reconnecting each time
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -114,6 +120,8 @@ DATABASES = {
 #         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
 #         'HOST': os.environ.get('DB_HOST', 'localhost'),
 #         'PORT': os.environ.get('DB_PORT', '5432'),
+#         'CONN_MAX_AGE': 60,
+#         'CONN_HEALTH_CHECKS': True,
 #     }
 # }
 
@@ -140,6 +148,13 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2id first; PBKDF2 stays so existing hashes verify (and get re-hashed on login)
+PASSWORD_HASHERS = [
+    'bondingapp.core.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -163,7 +178,15 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# WhiteNoise serves hashed, precompressed files with far-future cache headers
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -178,7 +201,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'bondingapp.core.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -191,10 +214,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ),
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'bondingapp.core.renderers.ORJSONRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'rest_framework.parsers.JSONParser',
+        'bondingapp.core.parsers.ORJSONParser',
         'rest_framework.parsers.MultiPartParser',
         'rest_framework.parsers.FormParser',
     ),
@@ -208,6 +231,7 @@ REST_FRAMEWORK = {
         'anon': '100/hour',
         'user': '1000/hour',
         'partner_link': '10/hour',  # Limit partner linking attempts
+        'login': '10/min',          # Per IP, before any password hashing / token verification
         'coin_spend': '50/hour',     # Limit coin spending
     }
 }
@@ -323,6 +347,10 @@ CACHE_TTL = {
     'CATEGORIES': 60 * 60 * 24,   # 24 hours
     'ACTIVITY_DETAIL': 60 * 30,    # 30 minutes
     'USER_STATS': 60 * 5,          # 5 minutes
+    'CATEGORY': 60 * 60,           # 1 hour, per serialized category
+    'STREAK': 60,                  # 1 minute, per user and day
+    'OVERVIEW': 60,                # 1 minute, per user and day
+    'ACHIEVEMENT_CATALOG': 60 * 60,  # 1 hour, per language
 }
 
 # If Redis is not available, fall back to in-memory cache
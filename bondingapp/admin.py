@@ -3,36 +3,84 @@ Django Admin Configuration with Import/Export
 Location: bondingapp/admin.py
 """
 
+import orjson
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.html import format_html
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import Count
+from django.db.models.functions import Now
+from django.utils.functional import cached_property
+from django.utils.html import conditional_escape
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from import_export import resources, fields
+from import_export import resources, fields, widgets
 from import_export.admin import ImportExportModelAdmin, ExportActionMixin
+from import_export.formats import base_formats
 from import_export.widgets import ForeignKeyWidget, ManyToManyWidget
+from bondingapp.core.serializers import (
+    invalidate_achievement_catalogs, invalidate_activity_listings, invalidate_category_cache
+)
 from bondingapp.models import (
     User, UserPreference, ActivityCategory, Activity,
     ActivitySession, ActivityCompletion, Streak, Badge,
     UserBadge, Milestone, UserMilestone, Notification,
-    SkipLimit, CoinTransaction
+    SkipLimit, CoinTransaction, BondScoreSnapshot
 )
 
-import json
-from import_export import resources, fields, widgets
-from import_export.admin import ImportExportModelAdmin
-from bondingapp.models import Activity, ActivityCategory
-
 # ============================================
 # RESOURCES (Define what/how to import/export)
 # ============================================
 
-class UserResource(resources.ModelResource):
+class CachedForeignKeyWidget(ForeignKeyWidget):
+    """ForeignKeyWidget that resolves rows from one prefetched lookup table"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lookup = None
+    
+    def clean(self, value, row=None, **kwargs):
+        """Resolve the related object by dict lookup instead of a query per row"""
+        if not value:
+            return None
+        
+        if self._lookup is None:
+            queryset = self.get_queryset(value, row, **kwargs).only('pk', self.field)
+            self._lookup = {
+                str(getattr(obj, self.field)): obj
+                for obj in queryset.iterator(chunk_size=5000)
+            }
+        
+        try:
+            return self._lookup[str(value)]
+        except KeyError:
+            raise self.model.DoesNotExist(
+                f'{self.model.__name__} matching {self.field}={value!r} does not exist.'
+            )
+
+
+class BulkModelResource(resources.ModelResource):
+    """ModelResource for use_bulk imports that match rows on a natural key"""
+    
+    def import_field(self, field, instance, row, is_m2m=False, **kwargs):
+        """Keep the primary key of rows matched on the natural key"""
+        if field.attribute == self._meta.model._meta.pk.name and not instance._state.adding:
+            return
+        super().import_field(field, instance, row, is_m2m, **kwargs)
+    
+    def get_bulk_update_fields(self):
+        """bulk_update() rejects the primary key even when it is only exported"""
+        pk_name = self._meta.model._meta.pk.name
+        return [name for name in super().get_bulk_update_fields() if name != pk_name]
+
+
+class UserResource(BulkModelResource):
     """Resource for User model import/export"""
     partner = fields.Field(
         column_name='partner',
         attribute='partner',
-        widget=ForeignKeyWidget(User, 'email')
+        widget=CachedForeignKeyWidget(User, 'email')
     )
     
     class Meta:
@@ -47,9 +95,12 @@ class UserResource(resources.ModelResource):
         import_id_fields = ['email']  # Use email as unique identifier for imports
         skip_unchanged = True
         report_skipped = True
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
 
 
-class ActivityCategoryResource(resources.ModelResource):
+class ActivityCategoryResource(BulkModelResource):
     """Resource for ActivityCategory import/export"""
     
     class Meta:
@@ -60,14 +111,23 @@ class ActivityCategoryResource(resources.ModelResource):
         )
         export_order = fields
         import_id_fields = ['name_en']
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+        skip_diff = True
+    
+    def after_import(self, dataset, result, **kwargs):
+        """Bulk saves send no post_save, so drop the category caches here"""
+        super().after_import(dataset, result, **kwargs)
+        invalidate_category_cache(ActivityCategory.objects.values_list('pk', flat=True))
 
 
-class ActivityResource(resources.ModelResource):
+class ActivityResource(BulkModelResource):
     """Resource for Activity import/export"""
     category = fields.Field(
         column_name='category',
         attribute='category',
-        widget=ForeignKeyWidget(ActivityCategory, 'name_en')
+        widget=CachedForeignKeyWidget(ActivityCategory, 'name_en')
     )
     
     class Meta:
@@ -79,6 +139,15 @@ class ActivityResource(resources.ModelResource):
             'is_premium', 'unlock_cost_coins', 'is_active', 'is_daily_featured'
         )
         export_order = fields
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+        skip_diff = True
+    
+    def after_import(self, dataset, result, **kwargs):
+        """Bulk saves send no post_save, so drop the cached listings here"""
+        super().after_import(dataset, result, **kwargs)
+        invalidate_activity_listings()
 
 
 class ActivityCompletionResource(resources.ModelResource):
@@ -86,12 +155,12 @@ class ActivityCompletionResource(resources.ModelResource):
     user = fields.Field(
         column_name='user',
         attribute='user',
-        widget=ForeignKeyWidget(User, 'email')
+        widget=CachedForeignKeyWidget(User, 'email')
     )
     activity = fields.Field(
         column_name='activity',
         attribute='activity',
-        widget=ForeignKeyWidget(Activity, 'title_en')
+        widget=CachedForeignKeyWidget(Activity, 'title_en')
     )
     
     class Meta:
@@ -101,9 +170,15 @@ class ActivityCompletionResource(resources.ModelResource):
             'coins_earned', 'shared_with_partner', 'completed_at'
         )
         export_order = fields
+        # Append-only log: never match existing rows, insert in batches
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+        skip_diff = True
+        force_init_instance = True
 
 
-class BadgeResource(resources.ModelResource):
+class BadgeResource(BulkModelResource):
     """Resource for Badge import/export"""
     
     class Meta:
@@ -114,6 +189,15 @@ class BadgeResource(resources.ModelResource):
             'rarity', 'is_active'
         )
         export_order = fields
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+        skip_diff = True
+    
+    def after_import(self, dataset, result, **kwargs):
+        """Bulk saves send no post_save, so drop the cached catalogs here"""
+        super().after_import(dataset, result, **kwargs)
+        invalidate_achievement_catalogs()
 
 
 class CoinTransactionResource(resources.ModelResource):
@@ -121,7 +205,7 @@ class CoinTransactionResource(resources.ModelResource):
     user = fields.Field(
         column_name='user',
         attribute='user',
-        widget=ForeignKeyWidget(User, 'email')
+        widget=CachedForeignKeyWidget(User, 'email')
     )
     
     class Meta:
@@ -131,26 +215,102 @@ class CoinTransactionResource(resources.ModelResource):
             'description', 'created_at'
         )
         export_order = fields
+        # Append-only log: never match existing rows, insert in batches
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+        skip_diff = True
+        force_init_instance = True
 
 
 # ============================================
 # ADMIN CLASSES
 # ============================================
 
+# CSV/JSON only: XLSX/ODS/XLS would pull in openpyxl/odfpy on every worker
+IMPORT_EXPORT_FORMATS = [base_formats.CSV, base_formats.JSON]
+
+
+# Rows per UPDATE in bulk admin actions; keeps each transaction's row locks short
+ADMIN_UPDATE_BATCH_SIZE = 1000
+
+
+def update_in_batches(queryset, **values):
+    """Apply queryset.update(**values) in pk batches, one transaction per batch"""
+    pks = list(queryset.values_list('pk', flat=True))
+    updated = 0
+    for start in range(0, len(pks), ADMIN_UPDATE_BATCH_SIZE):
+        with transaction.atomic():
+            updated += queryset.model.objects.filter(
+                pk__in=pks[start:start + ADMIN_UPDATE_BATCH_SIZE]
+            ).update(**values)
+    return updated
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large log tables.
+    Unfiltered changelists on PostgreSQL use the planner's row estimate
+    (pg_class.reltuples) instead of COUNT(*); everything else counts exactly.
+    """
+    
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # reltuples is 0 or -1 until the table has been analyzed
+            if row and row[0] > 0:
+                return int(row[0])
+        return super().count
+
+
+class ListOnlyChangeList(ChangeList):
+    """ChangeList that loads only the columns the list page renders"""
+    
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        return queryset.only(*self.model_admin.list_only_fields)
+
+
+class ListOnlyAdminMixin:
+    """
+    Restrict changelist queries to `list_only_fields`.
+    The change form still uses the full queryset from get_queryset().
+    """
+    list_only_fields = ()
+    
+    def get_changelist(self, request, **kwargs):
+        return ListOnlyChangeList
+    
+    def get_export_queryset(self, request):
+        # Exports are built from the changelist queryset but need every column
+        return super().get_export_queryset(request).defer(None)
+
+
 @admin.register(User)
 class UserAdmin(ImportExportModelAdmin, BaseUserAdmin):
     """Admin for User model with import/export"""
     resource_class = UserResource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'username', 'email', 'partner_link', 'current_level', 
         'total_points', 'coins', 'is_online', 'created_at'
     )
+    list_select_related = ('partner',)
     list_filter = (
         'is_active', 'is_staff', 'current_level', 
         'preferred_language', 'theme', 'created_at'
     )
-    search_fields = ('username', 'email', 'first_name', 'last_name')
+    # Exact/prefix lookups so searches can use the username/email indexes
+    search_fields = ('=email', '^username', '^first_name', '^last_name')
     ordering = ('-created_at',)
     
     fieldsets = (
@@ -178,13 +338,32 @@ class UserAdmin(ImportExportModelAdmin, BaseUserAdmin):
         }),
     )
     
-    readonly_fields = ('last_active', 'created_at', 'updated_at')
+    readonly_fields = ('current_level', 'last_active', 'created_at', 'updated_at')
+    
+    # ID inputs with lookup popups instead of rendering every user/group/permission
+    filter_horizontal = ()
+    raw_id_fields = ('partner', 'groups', 'user_permissions')
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Also match an invitation code exactly (unique index, codes are uppercase)"""
+        base_queryset = queryset
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        code = search_term.strip().upper()
+        if len(code) == 8 and code.isalnum():
+            queryset |= base_queryset.filter(partner_invitation_code=code)
+        return queryset, may_have_duplicates
+    
+    # Change URL with an id placeholder, resolved once on first use
+    _partner_url = None
+    _partner_link_html = '<a href="{}">{}</a>'
     
     def partner_link(self, obj):
         """Display partner as clickable link"""
         if obj.partner:
-            url = reverse('admin:bondingapp_user_change', args=[obj.partner.id])
-            return format_html('<a href="{}">{}</a>', url, obj.partner.username)
+            if UserAdmin._partner_url is None:
+                UserAdmin._partner_url = reverse('admin:bondingapp_user_change', args=['__id__'])
+            url = self._partner_url.replace('__id__', str(obj.partner_id))
+            return mark_safe(self._partner_link_html.format(url, conditional_escape(obj.partner.username)))
         return '-'
     partner_link.short_description = 'Partner'
 
@@ -196,17 +375,19 @@ class UserPreferenceAdmin(admin.ModelAdmin):
         'user', 'daily_reminder_enabled', 'daily_reminder_time',
         'partner_activity_alerts', 'activity_difficulty'
     )
+    list_select_related = ('user',)
     list_filter = (
         'daily_reminder_enabled', 'partner_activity_alerts',
         'streak_reminders', 'activity_difficulty'
     )
-    search_fields = ('user__username', 'user__email')
+    search_fields = ('^user__username', '=user__email')
 
 
 @admin.register(ActivityCategory)
 class ActivityCategoryAdmin(ImportExportModelAdmin):
     """Admin for ActivityCategory with import/export"""
     resource_class = ActivityCategoryResource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'icon_display', 'name_en', 'name_hi', 'color_display',
@@ -217,6 +398,11 @@ class ActivityCategoryAdmin(ImportExportModelAdmin):
     ordering = ('display_order', 'name_en')
     list_editable = ('display_order', 'is_active')
     
+    _color_html = (
+        '<span style="background-color: {0}; padding: 5px 15px; '
+        'border-radius: 3px; color: white;">{0}</span>'
+    )
+    
     def icon_display(self, obj):
         """Display icon emoji"""
         return obj.icon
@@ -224,76 +410,37 @@ class ActivityCategoryAdmin(ImportExportModelAdmin):
     
     def color_display(self, obj):
         """Display color swatch"""
-        return format_html(
-            '<span style="background-color: {}; padding: 5px 15px; border-radius: 3px; color: white;">{}</span>',
-            obj.color, obj.color
-        )
+        color = conditional_escape(obj.color)
+        return mark_safe(self._color_html.format(color))
     color_display.short_description = 'Color'
     
     def activity_count(self, obj):
-        """Count activities in category"""
-        return obj.activities.filter(is_active=True).count()
+        """Count activities in category (denormalized, refreshed every 5 minutes)"""
+        return obj.activity_count
     activity_count.short_description = 'Activities'
-
-
-# @admin.register(Activity)
-class ActivityAdmin(ImportExportModelAdmin):
-    """Admin for Activity with import/export"""
-    resource_class = ActivityResource
-    
-    list_display = (
-        'title_en', 'category', 'difficulty', 'estimated_time_minutes',
-        'mode', 'points_reward', 'coins_reward', 'completion_count',
-        'is_premium', 'is_daily_featured', 'is_active'
-    )
-    list_filter = (
-        'category', 'difficulty', 'mode', 'best_time',
-        'is_premium', 'is_daily_featured', 'is_active'
-    )
-    search_fields = ('title_en', 'title_hi', 'description_en', 'description_hi')
-    ordering = ('-created_at',)
-    list_editable = ('is_daily_featured', 'is_active')
-    
-    fieldsets = (
-        ('Basic Info', {
-            'fields': ('category', 'title_en', 'title_hi', 'description_en', 'description_hi')
-        }),
-        ('Instructions', {
-            'fields': ('instructions_en', 'instructions_hi'),
-            'classes': ('collapse',)
-        }),
-        ('Metadata', {
-            'fields': ('difficulty', 'estimated_time_minutes', 'best_time', 'mode')
-        }),
-        ('Materials & Tips', {
-            'fields': ('materials_needed_en', 'materials_needed_hi', 'tips_en', 'tips_hi'),
-            'classes': ('collapse',)
-        }),
-        ('Questions', {
-            'fields': ('questions_en', 'questions_hi'),
-            'classes': ('collapse',)
-        }),
-        ('Gamification', {
-            'fields': ('points_reward', 'coins_reward', 'is_premium', 'unlock_cost_coins')
-        }),
-        ('Status', {
-            'fields': ('is_active', 'is_daily_featured', 'completion_count', 'average_rating')
-        }),
-    )
-    
-    readonly_fields = ('completion_count', 'average_rating', 'created_at', 'updated_at')
+    activity_count.admin_order_field = 'activity_count'
 
 
 @admin.register(ActivitySession)
-class ActivitySessionAdmin(admin.ModelAdmin):
+class ActivitySessionAdmin(ListOnlyAdminMixin, admin.ModelAdmin):
     """Admin for ActivitySession"""
     list_display = (
         'user', 'activity', 'status', 'mode', 'started_at',
         'completed_at', 'time_spent_display'
     )
+    list_select_related = ('user', 'activity')
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'activity', 'activity__title_en',
+        'activity__difficulty', 'status', 'mode', 'started_at', 'completed_at',
+        'time_spent_seconds'
+    )
     list_filter = ('status', 'mode', 'started_at')
-    search_fields = ('user__username', 'activity__title_en')
+    search_fields = ('^user__username', '^activity__title_en')
     readonly_fields = ('started_at', 'completed_at')
+    date_hierarchy = 'started_at'
+    show_full_result_count = False
+    list_per_page = 25
+    paginator = EstimatedCountPaginator
     
     def time_spent_display(self, obj):
         """Display time spent in readable format"""
@@ -306,18 +453,28 @@ class ActivitySessionAdmin(admin.ModelAdmin):
 
 
 @admin.register(ActivityCompletion)
-class ActivityCompletionAdmin(ImportExportModelAdmin):
+class ActivityCompletionAdmin(ListOnlyAdminMixin, ImportExportModelAdmin):
     """Admin for ActivityCompletion with import/export"""
     resource_class = ActivityCompletionResource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'user', 'activity', 'rating_display', 'points_earned',
         'coins_earned', 'shared_with_partner', 'completed_at'
     )
+    list_select_related = ('user', 'activity')
     list_filter = ('rating', 'shared_with_partner', 'completed_at')
-    search_fields = ('user__username', 'activity__title_en')
+    search_fields = ('^user__username', '^activity__title_en')
     readonly_fields = ('completed_at',)
     date_hierarchy = 'completed_at'
+    show_full_result_count = False
+    list_per_page = 25
+    paginator = EstimatedCountPaginator
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'activity', 'activity__title_en',
+        'activity__difficulty', 'rating', 'points_earned', 'coins_earned',
+        'shared_with_partner', 'completed_at'
+    )
     
     def rating_display(self, obj):
         """Display rating as stars"""
@@ -334,8 +491,9 @@ class StreakAdmin(admin.ModelAdmin):
         'user', 'current_streak', 'longest_streak', 'last_activity_date',
         'total_active_days', 'is_active_display'
     )
+    list_select_related = ('user',)
     list_filter = ('last_activity_date',)
-    search_fields = ('user__username',)
+    search_fields = ('^user__username',)
     readonly_fields = ('created_at', 'updated_at')
     
     def is_active_display(self, obj):
@@ -348,6 +506,7 @@ class StreakAdmin(admin.ModelAdmin):
 class BadgeAdmin(ImportExportModelAdmin):
     """Admin for Badge with import/export"""
     resource_class = BadgeResource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'icon_display', 'name_en', 'category', 'rarity',
@@ -363,17 +522,23 @@ class BadgeAdmin(ImportExportModelAdmin):
     icon_display.short_description = 'Icon'
     
     def unlocked_count(self, obj):
-        """Count how many users unlocked this badge"""
-        return UserBadge.objects.filter(badge=obj).count()
+        """Count how many users unlocked this badge (denormalized, refreshed every 5 minutes)"""
+        return obj.unlocked_count
     unlocked_count.short_description = 'Unlocked By'
+    unlocked_count.admin_order_field = 'unlocked_count'
 
 
 @admin.register(UserBadge)
-class UserBadgeAdmin(admin.ModelAdmin):
+class UserBadgeAdmin(ListOnlyAdminMixin, admin.ModelAdmin):
     """Admin for UserBadge"""
     list_display = ('user', 'badge', 'unlocked_at', 'is_displayed')
+    list_select_related = ('user', 'badge')
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'badge', 'badge__icon',
+        'badge__name_en', 'unlocked_at', 'is_displayed'
+    )
     list_filter = ('is_displayed', 'unlocked_at')
-    search_fields = ('user__username', 'badge__name_en')
+    search_fields = ('^user__username', '^badge__name_en')
     readonly_fields = ('unlocked_at',)
 
 
@@ -392,45 +557,62 @@ class MilestoneAdmin(admin.ModelAdmin):
         return obj.icon
     icon_display.short_description = 'Icon'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_achieved_count=Count('user_milestones'))
+    
     def achieved_count(self, obj):
         """Count achievements"""
-        return UserMilestone.objects.filter(milestone=obj).count()
+        return obj._achieved_count
     achieved_count.short_description = 'Achieved By'
+    achieved_count.admin_order_field = '_achieved_count'
 
 
 @admin.register(UserMilestone)
-class UserMilestoneAdmin(admin.ModelAdmin):
+class UserMilestoneAdmin(ListOnlyAdminMixin, admin.ModelAdmin):
     """Admin for UserMilestone"""
     list_display = ('user', 'milestone', 'achieved_at', 'partner_also_achieved')
+    list_select_related = ('user', 'milestone')
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'milestone', 'milestone__icon',
+        'milestone__name_en', 'achieved_at', 'partner_also_achieved'
+    )
     list_filter = ('partner_also_achieved', 'achieved_at')
-    search_fields = ('user__username', 'milestone__name_en')
+    search_fields = ('^user__username', '^milestone__name_en')
     readonly_fields = ('achieved_at',)
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ListOnlyAdminMixin, admin.ModelAdmin):
     """Admin for Notification"""
     list_display = (
         'user', 'notification_type', 'title_en', 'is_read',
         'is_sent', 'created_at'
     )
+    list_select_related = ('user',)
     list_filter = ('notification_type', 'is_read', 'is_sent', 'created_at')
-    search_fields = ('user__username', 'title_en', 'message_en')
+    search_fields = ('^user__username', '^title_en')
     readonly_fields = ('created_at', 'read_at')
     date_hierarchy = 'created_at'
+    show_full_result_count = False
+    list_per_page = 25
+    paginator = EstimatedCountPaginator
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'notification_type',
+        'title_en', 'is_read', 'is_sent', 'created_at'
+    )
     
     actions = ['mark_as_sent', 'mark_as_read']
     
     def mark_as_sent(self, request, queryset):
         """Mark notifications as sent"""
-        updated = queryset.update(is_sent=True)
+        updated = update_in_batches(queryset.filter(is_sent=False), is_sent=True)
         self.message_user(request, f'{updated} notifications marked as sent.')
     mark_as_sent.short_description = 'Mark selected as sent'
     
     def mark_as_read(self, request, queryset):
         """Mark notifications as read"""
-        from django.utils import timezone
-        updated = queryset.update(is_read=True, read_at=timezone.now())
+        # Already-read rows keep their original read_at
+        updated = update_in_batches(queryset.filter(is_read=False), is_read=True, read_at=Now())
         self.message_user(request, f'{updated} notifications marked as read.')
     mark_as_read.short_description = 'Mark selected as read'
 
@@ -439,36 +621,57 @@ class NotificationAdmin(admin.ModelAdmin):
 class SkipLimitAdmin(admin.ModelAdmin):
     """Admin for SkipLimit"""
     list_display = ('user', 'date', 'skips_used', 'max_skips_per_day', 'can_skip_display')
+    list_select_related = ('user',)
     list_filter = ('date',)
-    search_fields = ('user__username',)
+    search_fields = ('^user__username',)
     
     def can_skip_display(self, obj):
         """Display if user can skip"""
-        return '✅' if obj.can_skip() else '❌'
+        return obj.can_skip()
     can_skip_display.short_description = 'Can Skip'
+    can_skip_display.boolean = True
+    can_skip_display.admin_order_field = 'remaining_skips'
+
+
+@admin.register(BondScoreSnapshot)
+class BondScoreSnapshotAdmin(admin.ModelAdmin):
+    """Admin for BondScoreSnapshot (written by the nightly task)"""
+    list_display = ('user', 'date', 'score')
+    list_select_related = ('user',)
+    list_filter = ('date',)
+    search_fields = ('^user__username',)
 
 
 @admin.register(CoinTransaction)
-class CoinTransactionAdmin(ImportExportModelAdmin):
+class CoinTransactionAdmin(ListOnlyAdminMixin, ImportExportModelAdmin):
     """Admin for CoinTransaction with import/export"""
     resource_class = CoinTransactionResource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'user', 'transaction_type', 'amount_display', 'balance_after',
         'description', 'created_at'
     )
+    list_select_related = ('user',)
     list_filter = ('transaction_type', 'created_at')
-    search_fields = ('user__username', 'description')
+    search_fields = ('^user__username',)
     readonly_fields = ('created_at',)
     date_hierarchy = 'created_at'
+    show_full_result_count = False
+    list_per_page = 25
+    paginator = EstimatedCountPaginator
+    list_only_fields = (
+        'user', 'user__username', 'user__email', 'transaction_type',
+        'amount', 'balance_after', 'description', 'created_at'
+    )
+    
+    _amount_html = '<span style="color: {}; font-weight: bold;">{:+d}</span>'
     
     def amount_display(self, obj):
         """Display amount with color"""
+        # Both values are trusted (literal color, integer amount): no escaping needed
         color = 'green' if obj.amount > 0 else 'red'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{:+d}</span>',
-            color, obj.amount
-        )
+        return mark_safe(self._amount_html.format(color, obj.amount))
     amount_display.short_description = 'Amount'
 
 
@@ -505,10 +708,11 @@ class JSONWidget(widgets.Widget):
             return value
         
         # If it's a string, try to parse it as JSON
+        # (parsed per row: rows must not share one mutable list/dict)
         if isinstance(value, str):
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 # If it fails, return empty list
                 return []
         
@@ -518,7 +722,7 @@ class JSONWidget(widgets.Widget):
         """Convert JSON to string (for export)"""
         if value is None:
             return ""
-        return json.dumps(value, ensure_ascii=False)
+        return orjson.dumps(value).decode()
 
 
 class ActivityResourceWithJSON(resources.ModelResource):
@@ -528,7 +732,7 @@ class ActivityResourceWithJSON(resources.ModelResource):
     category = fields.Field(
         column_name='category',
         attribute='category',
-        widget=widgets.ForeignKeyWidget(ActivityCategory, 'name_en')
+        widget=CachedForeignKeyWidget(ActivityCategory, 'name_en')
     )
     
     # JSON fields with custom widget
@@ -590,36 +794,64 @@ class ActivityResourceWithJSON(resources.ModelResource):
         import_id_fields = ['id']  # Use UUID as unique identifier
         skip_unchanged = True
         report_skipped = True
+        use_bulk = True
+        batch_size = 1000
+        chunk_size = 5000
+    
+    def before_import(self, dataset, **kwargs):
+        """Resolve (and create missing) categories once for the whole file"""
+        names = set()
+        if 'category' in dataset.headers:
+            names = {name for name in dataset['category'] if name}
+        
+        self._category_cache = {
+            category.name_en: category
+            for category in ActivityCategory.objects.filter(name_en__in=names)
+        }
+        
+        missing = [
+            ActivityCategory(
+                name_en=name,
+                name_hi=name,
+                description_en=f'{name} activities',
+                description_hi=f'{name} गतिविधियाँ',
+                icon='💬',
+                color='#FFB6C1'
+            )
+            for name in names - self._category_cache.keys()
+        ]
+        if missing:
+            ActivityCategory.objects.bulk_create(missing, ignore_conflicts=True)
+            self._category_cache.update({category.name_en: category for category in missing})
+        
+        return super().before_import(dataset, **kwargs)
     
     def before_import_row(self, row, **kwargs):
         """Pre-process row before import"""
-        # Ensure category exists (get or create)
         category_name = row.get('category')
         if category_name:
-            category, created = ActivityCategory.objects.get_or_create(
-                name_en=category_name,
-                defaults={
-                    'name_hi': category_name,
-                    'description_en': f'{category_name} activities',
-                    'description_hi': f'{category_name} गतिविधियाँ',
-                    'icon': '💬',
-                    'color': '#FFB6C1'
-                }
-            )
-            row['category'] = category.name_en
+            row['category'] = self._category_cache[category_name].name_en
 
 
 # Update your ActivityAdmin to use this resource
 @admin.register(Activity)
-class ActivityAdmin(ImportExportModelAdmin):
+class ActivityAdmin(ListOnlyAdminMixin, ImportExportModelAdmin):
     """Admin for Activity with custom JSON import/export"""
     resource_class = ActivityResourceWithJSON  # ✅ Use custom resource
+    formats = IMPORT_EXPORT_FORMATS
     
     list_display = (
         'title_en', 'category', 'difficulty', 'estimated_time_minutes',
         'mode', 'points_reward', 'coins_reward', 'completion_count',
         'is_premium', 'is_daily_featured', 'is_active'
     )
+    list_select_related = ('category',)
+    # Skip the JSON content columns and long descriptions on the list page
+    list_only_fields = (
+        'category', 'category__icon', 'category__name_en', 'title_en', 'difficulty',
+        'estimated_time_minutes', 'mode', 'points_reward', 'coins_reward',
+        'completion_count', 'is_premium', 'is_daily_featured', 'is_active'
+    )
     list_filter = (
         'category', 'difficulty', 'mode', 'best_time',
         'is_premium', 'is_daily_featured', 'is_active'
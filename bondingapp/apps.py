@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BondingappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'bondingapp'
+    
+    def ready(self):
+        from bondingapp import signals  # noqa: F401
@@ -16,6 +16,7 @@ from rest_framework.exceptions import (
     MethodNotAllowed,
     Throttled,
 )
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -80,69 +81,57 @@ def custom_exception_handler(exc, context):
         )
     
     # Customize DRF exception responses
-    error_data = {
-        "error": {
-            "code": get_error_code(exc),
-            "message": get_error_message(exc),
-        }
-    }
+    code, message = _lookup_error(type(exc))
+    detail = getattr(exc, 'detail', None)
     
-    # Add details if available
-    if hasattr(exc, 'detail'):
-        if isinstance(exc.detail, dict):
-            error_data["error"]["details"] = exc.detail
-        elif isinstance(exc.detail, list):
-            error_data["error"]["details"] = exc.detail
-        else:
-            error_data["error"]["message"] = str(exc.detail)
+    # Structured details are attached as-is; a plain detail replaces the message
+    if isinstance(detail, (dict, list)):
+        error = {"code": code, "message": message, "details": detail}
+    elif detail is not None:
+        error = {"code": code, "message": str(detail)}
+    else:
+        error = {"code": code, "message": message}
     
     # Add throttle information
     if isinstance(exc, Throttled):
-        error_data["error"]["retry_after_seconds"] = exc.wait
+        error["retry_after_seconds"] = exc.wait
     
-    response.data = error_data
+    response.data = {"error": error}
     
     return response
 
 
+# (error code, user-friendly message) per DRF exception class
+_ERRORS_BY_CLASS = {
+    ValidationError: ("validation_error", "The provided data is invalid."),
+    AuthenticationFailed: ("authentication_failed", "Authentication failed. Please check your credentials."),
+    NotAuthenticated: ("not_authenticated", "Authentication required. Please log in."),
+    PermissionDenied: ("permission_denied", "You don't have permission to perform this action."),
+    NotFound: ("not_found", "The requested resource was not found."),
+    MethodNotAllowed: ("method_not_allowed", "This HTTP method is not allowed for this endpoint."),
+    Throttled: ("rate_limit_exceeded", "Too many requests. Please slow down."),
+}
+
+_DEFAULT_ERROR = ("error", "An error occurred.")
+
+
+@lru_cache(maxsize=256)
+def _lookup_error(exc_class):
+    """Walk the MRO once per exception class and cache the matching entry"""
+    for klass in exc_class.__mro__:
+        if klass in _ERRORS_BY_CLASS:
+            return _ERRORS_BY_CLASS[klass]
+    return _DEFAULT_ERROR
+
+
 def get_error_code(exc):
     """Get error code based on exception type"""
-    
-    error_codes = {
-        ValidationError: "validation_error",
-        AuthenticationFailed: "authentication_failed",
-        NotAuthenticated: "not_authenticated",
-        PermissionDenied: "permission_denied",
-        NotFound: "not_found",
-        MethodNotAllowed: "method_not_allowed",
-        Throttled: "rate_limit_exceeded",
-    }
-    
-    for exception_class, code in error_codes.items():
-        if isinstance(exc, exception_class):
-            return code
-    
-    return "error"
+    return _lookup_error(type(exc))[0]
 
 
 def get_error_message(exc):
     """Get user-friendly error message"""
-    
-    error_messages = {
-        ValidationError: "The provided data is invalid.",
-        AuthenticationFailed: "Authentication failed. Please check your credentials.",
-        NotAuthenticated: "Authentication required. Please log in.",
-        PermissionDenied: "You don't have permission to perform this action.",
-        NotFound: "The requested resource was not found.",
-        MethodNotAllowed: "This HTTP method is not allowed for this endpoint.",
-        Throttled: "Too many requests. Please slow down.",
-    }
-    
-    for exception_class, message in error_messages.items():
-        if isinstance(exc, exception_class):
-            return message
-    
-    return "An error occurred."
+    return _lookup_error(type(exc))[1]
 
 
 # Custom exception classes
@@ -0,0 +1,97 @@
+"""
+Google ID token verification for Bonding App
+Location: bondingapp/core/google_auth.py
+"""
+
+import re
+import threading
+import time
+
+import orjson
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from google.auth import jwt as google_jwt
+from google.auth.transport import requests as google_requests
+from requests.adapters import HTTPAdapter
+
+GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+
+# Used when Google's response carries no Cache-Control max-age
+GOOGLE_CERTS_TTL_SECONDS = 3600
+# Bad tokens must not turn every request into a certificate download
+GOOGLE_CERTS_MIN_REFRESH_SECONDS = 300
+GOOGLE_CERTS_TIMEOUT_SECONDS = 10
+GOOGLE_CERTS_CACHE_KEY = 'google_oauth_certs'
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+# One transport over one pooled keep-alive session per process instead of one per login
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+_transport = google_requests.Request(session=_session)
+_certs_lock = threading.Lock()
+_certs = None
+_certs_expires_at = 0.0
+_certs_fetched_at = 0.0
+
+
+def _fetch_certs():
+    """Download the certificates; returns (certs, seconds they may be cached)"""
+    response = _transport(GOOGLE_CERTS_URL, method='GET', timeout=GOOGLE_CERTS_TIMEOUT_SECONDS)
+    if response.status != 200:
+        raise ValueError(f"Could not fetch Google certificates (status {response.status})")
+    max_age = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+    ttl = int(max_age.group(1)) if max_age else GOOGLE_CERTS_TTL_SECONDS
+    return orjson.loads(response.data), ttl
+
+
+def get_google_certs(force_refresh=False):
+    """
+    Google's public signing certificates, kept per process and in the shared
+    cache for as long as Google's max-age allows, so other workers skip the download
+    """
+    global _certs, _certs_expires_at, _certs_fetched_at
+    with _certs_lock:
+        now = time.monotonic()
+        if _certs is not None:
+            if force_refresh:
+                if now - _certs_fetched_at < GOOGLE_CERTS_MIN_REFRESH_SECONDS:
+                    return _certs
+            elif now < _certs_expires_at:
+                return _certs
+        
+        if not force_refresh:
+            shared = cache.get(GOOGLE_CERTS_CACHE_KEY)
+            if shared is not None:
+                _certs, expires_at = shared
+                _certs_expires_at = now + (expires_at - time.time())
+                return _certs
+        
+        _certs, ttl = _fetch_certs()
+        _certs_fetched_at = now
+        _certs_expires_at = now + ttl
+        cache.set(GOOGLE_CERTS_CACHE_KEY, (_certs, time.time() + ttl), ttl)
+        return _certs
+
+
+def verify_google_id_token(token):
+    """
+    Verify a Google ID token locally against the cached certificates.
+    Same checks as google.oauth2.id_token.verify_oauth2_token; raises ValueError.
+    """
+    try:
+        idinfo = google_jwt.decode(
+            token, certs=get_google_certs(), audience=settings.GOOGLE_OAUTH_CLIENT_ID
+        )
+    except ValueError:
+        # Possibly signed with a key newer than our cache: refresh once and retry
+        idinfo = google_jwt.decode(
+            token, certs=get_google_certs(force_refresh=True),
+            audience=settings.GOOGLE_OAUTH_CLIENT_ID
+        )
+    
+    if idinfo.get('iss') not in GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {idinfo.get('iss')}")
+    return idinfo
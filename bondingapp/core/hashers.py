@@ -0,0 +1,16 @@
+"""
+Password hashers for Bonding App
+Location: bondingapp/core/hashers.py
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id sized for the login endpoint's latency budget (~30-50ms per
+    verify). Hashes made with other parameters are upgraded on next login.
+    """
+    time_cost = 2
+    memory_cost = 65536  # KiB
+    parallelism = 2
@@ -0,0 +1,22 @@
+"""
+Custom DRF renderers for Bonding App
+Location: bondingapp/core/renderers.py
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson (native encoder, emits bytes directly)"""
+    
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    
+    # Fallback for types orjson doesn't know (lazy strings, Decimal, ...)
+    _fallback = JSONEncoder().default
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._fallback, option=self.options)
@@ -3,25 +3,148 @@ DRF Serializers for Bonding App
 Location: bondingapp/core/serializers.py
 """
 
+import copy
+import operator
+
 from rest_framework import serializers
+from django.db import models
+from django.db.models import Exists, F, OuterRef
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from bondingapp.models import (
     User, UserPreference, ActivityCategory, Activity, 
     ActivitySession, ActivityCompletion, Streak, Badge, 
     UserBadge, Milestone, UserMilestone, Notification, 
-    SkipLimit, CoinTransaction
+    SkipLimit, CoinTransaction, LEVEL_THRESHOLDS
 )
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta
+from django.utils.functional import cached_property
+from datetime import datetime, time, timedelta
 
 User = get_user_model()
 
 
+def day_start(day):
+    """
+    Local midnight of `day` as an aware datetime. Comparing completed_at with
+    day boundaries, instead of a __date lookup, keeps the (user, completed_at)
+    index usable: __date casts every row's timestamp first.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_range(day):
+    """completed_at__range-style [start, end) bounds of one local day"""
+    return day_start(day), day_start(day + timedelta(days=1))
+
+# Partner columns rendered by PartnerBasicSerializer
+_PARTNER_FIELDS = (
+    'id', 'username', 'email', 'profile_picture',
+    'is_online', 'last_active', 'current_level', 'total_points'
+)
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects its model once per class.
+    Each instance gets deep copies of the built fields, the same way DRF
+    already copies declared fields, instead of rebuilding them from the model.
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsModelSerializer._fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsModelSerializer._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+    
+    def update(self, instance, validated_data):
+        """
+        Write back only the submitted columns (plus auto_now ones). A full-row
+        save would also rewrite counters such as coins with stale values.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            auto_now = [
+                field.name for field in instance._meta.concrete_fields
+                if getattr(field, 'auto_now', False)
+            ]
+            instance.save(update_fields=[*validated_data, *auto_now])
+        return instance
+
+
+class RequestContextMixin:
+    """
+    Requesting user, language and date, resolved once per serializer instance
+    (a many=True child is one instance for the whole list)
+    """
+    
+    @cached_property
+    def _user(self):
+        request = self.context.get('request')
+        return request.user if request else None
+    
+    @cached_property
+    def _lang(self):
+        return getattr(self._user, 'preferred_language', None) or 'en'
+    
+    @cached_property
+    def _today(self):
+        # Views may share one date across serializers via context['today'];
+        # local date, to match the day_range() bounds
+        return self.context.get('today') or timezone.localdate()
+    
+    def bulk_prefetch(self, instances):
+        """Load into self.context what per-row fields need, for a whole list at once"""
+
+
+class ContextPrefetchListSerializer(serializers.ListSerializer):
+    """
+    many=True serializer that runs the child's bulk_prefetch once for the
+    page, so SerializerMethodFields become context lookups instead of
+    per-row queries
+    """
+    
+    def to_representation(self, data):
+        instances = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if instances:
+            self.child.bulk_prefetch(instances)
+        return super().to_representation(instances)
+
+
+class LocalizedFieldsMixin(RequestContextMixin):
+    """
+    Serve each field in `localized_fields` straight from its `<name>_hi` column
+    when the requesting user prefers Hindi. Fields are declared against the
+    `_en` column; the language is resolved once, when the fields are bound.
+    """
+    localized_fields = ()
+    # Columns the serializer never reads, whatever the language
+    unread_columns = ()
+    
+    @classmethod
+    def deferred_columns(cls, lang):
+        """Model columns a queryset can skip when serializing for `lang`"""
+        other = 'en' if lang == 'hi' else 'hi'
+        return [f'{name}_{other}' for name in cls.localized_fields] + list(cls.unread_columns)
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        if self._lang == 'hi':
+            for name in self.localized_fields:
+                fields[name] = serializers.ReadOnlyField(source=f'{name}_hi')
+        return fields
+
+
 # ============================================
 # USER & AUTHENTICATION SERIALIZERS
 # ============================================
 
-class UserPreferenceSerializer(serializers.ModelSerializer):
+class UserPreferenceSerializer(CachedFieldsModelSerializer):
     """Serializer for user preferences and notification settings"""
     
     class Meta:
@@ -29,7 +152,7 @@ class UserPreferenceSerializer(serializers.ModelSerializer):
         exclude = ['user', 'created_at', 'updated_at']
         
 
-class PartnerBasicSerializer(serializers.ModelSerializer):
+class PartnerBasicSerializer(CachedFieldsModelSerializer):
     """Basic partner information for nested serialization"""
     
     is_online = serializers.BooleanField(read_only=True)
@@ -37,14 +160,11 @@ class PartnerBasicSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = User
-        fields = [
-            'id', 'username', 'email', 'profile_picture', 
-            'is_online', 'last_active', 'current_level', 'total_points'
-        ]
-        read_only_fields = fields
+        fields = _PARTNER_FIELDS
+        read_only_fields = _PARTNER_FIELDS
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsModelSerializer):
     """Complete user profile serializer"""
     
     partner = PartnerBasicSerializer(read_only=True)
@@ -77,12 +197,17 @@ class UserSerializer(serializers.ModelSerializer):
         }
     
     def get_bond_score(self, obj):
-        """Calculate and return bond score"""
-        return obj.calculate_bond_score()
+        """Calculate and return bond score (from UserViewSet annotations when present)"""
+        return obj.calculate_bond_score(
+            user_completions=getattr(obj, '_recent_completions', None),
+            partner_completions=getattr(obj, '_partner_recent_completions', None),
+            streak=getattr(obj, '_current_streak', None)
+        )
     
     def get_current_streak(self, obj):
         """Get current activity streak"""
-        return obj.get_current_streak()
+        streak = getattr(obj, '_current_streak', None)
+        return obj.get_current_streak() if streak is None else streak
     
     def get_relationship_duration_days(self, obj):
         """Calculate relationship duration in days"""
@@ -93,15 +218,8 @@ class UserSerializer(serializers.ModelSerializer):
     
     def get_level_progress(self, obj):
         """Calculate progress to next level"""
-        level_thresholds = {
-            1: (0, 500),
-            2: (501, 1500),
-            3: (1501, 3000),
-            4: (3001, float('inf'))
-        }
-        
-        current_threshold = level_thresholds.get(obj.current_level, (0, 500))
-        if current_threshold[1] == float('inf'):
+        low, high = LEVEL_THRESHOLDS[min(max(obj.current_level, 1), len(LEVEL_THRESHOLDS)) - 1]
+        if high is None:
             return {
                 'current_level': obj.current_level,
                 'next_level': None,
@@ -109,23 +227,31 @@ class UserSerializer(serializers.ModelSerializer):
                 'points_needed': 0
             }
         
-        points_in_level = obj.total_points - current_threshold[0]
-        level_range = current_threshold[1] - current_threshold[0]
-        progress_percentage = (points_in_level / level_range) * 100
+        progress_percentage = (obj.total_points - low) / (high - low) * 100
         
         return {
             'current_level': obj.current_level,
             'next_level': obj.current_level + 1,
             'progress_percentage': round(progress_percentage, 2),
-            'points_needed': current_threshold[1] - obj.total_points
+            'points_needed': high - obj.total_points
         }
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+# Upper bounds checked before the costly work: signature verification of a
+# Google ID token, Argon2 hashing of a password
+GOOGLE_TOKEN_MAX_LENGTH = 4096
+PASSWORD_MAX_LENGTH = 128
+
+
+class UserRegistrationSerializer(CachedFieldsModelSerializer):
     """Serializer for user registration"""
     
-    password = serializers.CharField(write_only=True, required=False)
-    confirm_password = serializers.CharField(write_only=True, required=False)
+    password = serializers.CharField(
+        write_only=True, required=False, max_length=PASSWORD_MAX_LENGTH
+    )
+    confirm_password = serializers.CharField(
+        write_only=True, required=False, max_length=PASSWORD_MAX_LENGTH
+    )
     
     class Meta:
         model = User
@@ -148,16 +274,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('confirm_password', None)
         password = validated_data.pop('password', None)
         
-        user = User.objects.create(**validated_data)
+        # Password and invitation code are set before the single INSERT
+        user = User(**validated_data)
         if password:
             user.set_password(password)
-            user.save()
+        user.generate_invitation_code(save=False)
         
-        # Create default preferences
-        UserPreference.objects.create(user=user)
-        
-        # Generate invitation code
-        user.generate_invitation_code()
+        with transaction.atomic():
+            user.save()
+            
+            # Create default preferences
+            UserPreference.objects.create(user=user)
         
         return user
 
@@ -165,17 +292,13 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 class GoogleAuthSerializer(serializers.Serializer):
     """Serializer for Google OAuth authentication"""
     
-    google_token = serializers.CharField(required=True)
-    
-    def validate_google_token(self, value):
-        """Validate Google token (implement token verification)"""
-        if not value:
-            raise serializers.ValidationError("Google token is required")
-        return value
+    # CharField already rejects a missing or blank token
+    google_token = serializers.CharField(required=True, max_length=GOOGLE_TOKEN_MAX_LENGTH)
+
 
 class EmailLoginSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
-    password = serializers.CharField(required=True, write_only=True)
+    password = serializers.CharField(required=True, write_only=True, max_length=PASSWORD_MAX_LENGTH)
     
 
 class PartnerLinkSerializer(serializers.Serializer):
@@ -184,22 +307,60 @@ class PartnerLinkSerializer(serializers.Serializer):
     invitation_code = serializers.CharField(max_length=8, required=True)
     
     def validate_invitation_code(self, value):
-        """Validate invitation code exists"""
-        if not User.objects.filter(partner_invitation_code=value).exists():
+        """Validate invitation code exists and keep the matching user"""
+        code = value.upper()  # Codes are generated uppercase
+        partner = User.objects.filter(partner_invitation_code=code).first()
+        if partner is None:
             raise serializers.ValidationError("Invalid invitation code")
-        return value.upper()
+        self.context['partner_user'] = partner
+        return code
 
 
 # ============================================
 # ACTIVITY SERIALIZERS
 # ============================================
 
-class ActivityCategorySerializer(serializers.ModelSerializer):
+CATEGORY_LANGUAGES = ('en', 'hi')
+
+
+def category_cache_key(category_id, lang):
+    return f'category:{category_id}:{lang}'
+
+
+# Shared per-language endpoint caches; bump the version when the payload shape changes
+def categories_cache_key(lang):
+    return f'categories:v1:{lang}'
+
+
+def daily_activities_cache_key(lang):
+    return f'daily_activities:v1:{lang}'
+
+
+def invalidate_activity_listings():
+    """Drop the cached /activities/categories/ and /activities/daily/ payloads"""
+    cache.delete_many([
+        key for lang in CATEGORY_LANGUAGES
+        for key in (categories_cache_key(lang), daily_activities_cache_key(lang))
+    ])
+
+
+def invalidate_category_cache(category_ids):
+    """Drop cached category representations (after edits or counter refreshes)"""
+    cache.delete_many([
+        category_cache_key(category_id, lang)
+        for category_id in category_ids for lang in CATEGORY_LANGUAGES
+    ])
+    # Both listings embed the categories
+    invalidate_activity_listings()
+
+
+class ActivityCategorySerializer(LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Serializer for activity categories"""
     
-    name = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    activity_count = serializers.SerializerMethodField()
+    name = serializers.ReadOnlyField(source='name_en')
+    description = serializers.ReadOnlyField(source='description_en')
+    # Denormalized column, refreshed by the refresh_admin_counters task
+    activity_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = ActivityCategory
@@ -208,31 +369,73 @@ class ActivityCategorySerializer(serializers.ModelSerializer):
             'display_order', 'activity_count', 'is_active'
         ]
     
-    def get_name(self, obj):
-        """Get localized name based on user preference"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user and user.preferred_language == 'hi':
-            return obj.name_hi
-        return obj.name_en
-    
-    def get_description(self, obj):
-        """Get localized description"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user and user.preferred_language == 'hi':
-            return obj.description_hi
-        return obj.description_en
+    localized_fields = ('name', 'description')
     
-    def get_activity_count(self, obj):
-        """Count active activities in this category"""
-        return obj.activities.filter(is_active=True).count()
+    def to_representation(self, instance):
+        # Categories are near-static and nested in every activity row
+        key = category_cache_key(instance.pk, self._lang)
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache.set(key, data, settings.CACHE_TTL['CATEGORY'])
+        return data
 
 
-class ActivityListSerializer(serializers.ModelSerializer):
+class ActivityFlagsMixin(RequestContextMixin):
+    """
+    is_completed_today / is_unlocked for activity serializers. Taken from the
+    with_activity_flags annotations or a list's prefetched id sets when
+    present; otherwise both flags come from one EXISTS query per activity.
+    """
+    
+    def _load_flags(self, obj):
+        completions = ActivityCompletion.objects.filter(user=self._user, activity=OuterRef('pk'))
+        start, end = day_range(self._today)
+        flags = Activity.objects.filter(pk=obj.pk).values(
+            unlocked=Exists(completions),
+            completed_today=Exists(completions.filter(completed_at__gte=start, completed_at__lt=end))
+        ).first()
+        obj._is_unlocked = not obj.is_premium or flags['unlocked']
+        obj._is_completed_today = flags['completed_today']
+    
+    def get_is_completed_today(self, obj):
+        """Check if user completed this activity today"""
+        if not self._user:
+            return False
+        completed_today = getattr(obj, '_is_completed_today', None)
+        if completed_today is not None:
+            return completed_today
+        completed_today_ids = self.context.get('completed_today_ids')
+        if completed_today_ids is not None:
+            return obj.id in completed_today_ids
+        self._load_flags(obj)
+        return obj._is_completed_today
+    
+    def get_is_unlocked(self, obj):
+        """Check if premium activity is unlocked (completed at least once)"""
+        if not obj.is_premium:
+            return True
+        if not self._user:
+            return False
+        unlocked = getattr(obj, '_is_unlocked', None)
+        if unlocked is not None:
+            return unlocked
+        completed_activity_ids = self.context.get('completed_activity_ids')
+        if completed_activity_ids is not None:
+            return obj.id in completed_activity_ids
+        self._load_flags(obj)
+        return obj._is_unlocked
+
+
+class ActivityListSerializer(ActivityFlagsMixin, LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Lightweight serializer for activity listing"""
     
     category = ActivityCategorySerializer(read_only=True)
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+    title = serializers.ReadOnlyField(source='title_en')
+    description = serializers.ReadOnlyField(source='description_en')
+    # Declared: DRF maps the GeneratedField column to a ModelField, which
+    # cannot render a bare Decimal
+    average_rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
     is_completed_today = serializers.SerializerMethodField()
     is_unlocked = serializers.SerializerMethodField()
     
@@ -245,54 +448,64 @@ class ActivityListSerializer(serializers.ModelSerializer):
             'completion_count', 'average_rating', 'is_daily_featured',
             'is_completed_today', 'is_unlocked'
         ]
+        list_serializer_class = ContextPrefetchListSerializer
+    
+    localized_fields = ('title', 'description')
+    # Detail-only JSON columns
+    unread_columns = Activity.DETAIL_ONLY_FIELDS
+    
+    def bulk_prefetch(self, instances):
+        """The user's completions of the listed activities, ever and today"""
+        user = self._user
+        # Rows from ActivityViewSet already carry both flags (with_activity_flags)
+        if not user or hasattr(instances[0], '_is_unlocked'):
+            return
+        completed = list(ActivityCompletion.objects.filter(
+            user=user, activity_id__in=[activity.id for activity in instances]
+        ).values_list('activity_id', 'completed_at'))
+        today = self._today
+        self.context['completed_activity_ids'] = {activity_id for activity_id, _ in completed}
+        self.context['completed_today_ids'] = {
+            activity_id for activity_id, completed_at in completed
+            if timezone.localtime(completed_at).date() == today
+        }
     
-    def get_title(self, obj):
-        """Get localized title"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user and user.preferred_language == 'hi':
-            return obj.title_hi
-        return obj.title_en
-    
-    def get_description(self, obj):
-        """Get localized description"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user and user.preferred_language == 'hi':
-            return obj.description_hi
-        return obj.description_en
-    
-    def get_is_completed_today(self, obj):
-        """Check if user completed this activity today"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            today = timezone.now().date()
-            return ActivityCompletion.objects.filter(
-                user=user,
-                activity=obj,
-                completed_at__date=today
-            ).exists()
-        return False
-    
-    def get_is_unlocked(self, obj):
-        """Check if premium activity is unlocked"""
-        if not obj.is_premium:
-            return True
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            # Check if user has completed this premium activity before (means it's unlocked)
-            return ActivityCompletion.objects.filter(user=user, activity=obj).exists()
-        return False
+    # Columns rendered exactly as stored (ints, bools, choice values)
+    raw_fields = (
+        'difficulty', 'estimated_time_minutes', 'best_time', 'mode', 'is_premium',
+        'unlock_cost_coins', 'points_reward', 'coins_reward', 'completion_count',
+        'is_daily_featured'
+    )
+    _read_raw_fields = operator.attrgetter(*raw_fields)
+    
+    def to_representation(self, instance):
+        """
+        Same output as the declared fields, built by hand: the raw columns are
+        read in one attrgetter call instead of one DRF field per value
+        """
+        fields = self.fields
+        data = dict(zip(self.raw_fields, self._read_raw_fields(instance)))
+        data['id'] = str(instance.pk)
+        data['category'] = fields['category'].to_representation(instance.category)
+        for name in self.localized_fields:
+            data[name] = getattr(instance, fields[name].source)
+        data['average_rating'] = fields['average_rating'].to_representation(instance.average_rating)
+        data['is_completed_today'] = self.get_is_completed_today(instance)
+        data['is_unlocked'] = self.get_is_unlocked(instance)
+        return data
 
 
-class ActivityDetailSerializer(serializers.ModelSerializer):
+class ActivityDetailSerializer(ActivityFlagsMixin, LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Detailed serializer for single activity view"""
     
     category = ActivityCategorySerializer(read_only=True)
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    instructions = serializers.SerializerMethodField()
-    materials_needed = serializers.SerializerMethodField()
-    tips = serializers.SerializerMethodField()
-    questions = serializers.SerializerMethodField()
+    title = serializers.ReadOnlyField(source='title_en')
+    description = serializers.ReadOnlyField(source='description_en')
+    instructions = serializers.ReadOnlyField(source='instructions_en')
+    materials_needed = serializers.ReadOnlyField(source='materials_needed_en')
+    tips = serializers.ReadOnlyField(source='tips_en')
+    questions = serializers.ReadOnlyField(source='questions_en')
+    average_rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
     is_completed_today = serializers.SerializerMethodField()
     is_unlocked = serializers.SerializerMethodField()
     partner_status = serializers.SerializerMethodField()
@@ -308,68 +521,29 @@ class ActivityDetailSerializer(serializers.ModelSerializer):
             'is_completed_today', 'is_unlocked', 'partner_status'
         ]
     
-    def get_title(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.title_hi if user and user.preferred_language == 'hi' else obj.title_en
-    
-    def get_description(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.description_hi if user and user.preferred_language == 'hi' else obj.description_en
-    
-    def get_instructions(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.instructions_hi if user and user.preferred_language == 'hi' else obj.instructions_en
-    
-    def get_materials_needed(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.materials_needed_hi if user and user.preferred_language == 'hi' else obj.materials_needed_en
-    
-    def get_tips(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.tips_hi if user and user.preferred_language == 'hi' else obj.tips_en
-    
-    def get_questions(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.questions_hi if user and user.preferred_language == 'hi' else obj.questions_en
-    
-    def get_is_completed_today(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            today = timezone.now().date()
-            return ActivityCompletion.objects.filter(
-                user=user, activity=obj, completed_at__date=today
-            ).exists()
-        return False
-    
-    def get_is_unlocked(self, obj):
-        if not obj.is_premium:
-            return True
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            return ActivityCompletion.objects.filter(user=user, activity=obj).exists()
-        return False
+    localized_fields = (
+        'title', 'description', 'instructions', 'materials_needed', 'tips', 'questions'
+    )
     
     def get_partner_status(self, obj):
         """Get partner's activity status"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user and user.partner:
-            today = timezone.now().date()
-            partner_completed = ActivityCompletion.objects.filter(
-                user=user.partner,
-                activity=obj,
-                completed_at__date=today
-            ).exists()
-            
-            partner_in_progress = ActivitySession.objects.filter(
-                user=user.partner,
-                activity=obj,
-                status__in=['started', 'in_progress']
-            ).exists()
-            
-            return {
-                'completed': partner_completed,
-                'in_progress': partner_in_progress
-            }
+        user = self._user
+        if user and user.partner_id:
+            # Both flags in one round-trip
+            start, end = day_range(self._today)
+            return Activity.objects.filter(pk=obj.pk).values(
+                completed=Exists(ActivityCompletion.objects.filter(
+                    user_id=user.partner_id,
+                    activity=OuterRef('pk'),
+                    completed_at__gte=start,
+                    completed_at__lt=end
+                )),
+                in_progress=Exists(ActivitySession.objects.filter(
+                    user_id=user.partner_id,
+                    activity=OuterRef('pk'),
+                    status__in=['started', 'in_progress']
+                ))
+            ).first()
         return None
 
 
@@ -377,7 +551,7 @@ class ActivityDetailSerializer(serializers.ModelSerializer):
 # ACTIVITY SESSION & COMPLETION SERIALIZERS
 # ============================================
 
-class ActivitySessionSerializer(serializers.ModelSerializer):
+class ActivitySessionSerializer(CachedFieldsModelSerializer):
     """Serializer for activity sessions"""
     
     activity = ActivityListSerializer(read_only=True)
@@ -397,7 +571,7 @@ class ActivitySessionSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ActivityCompletionSerializer(serializers.ModelSerializer):
+class ActivityCompletionSerializer(CachedFieldsModelSerializer):
     """Serializer for activity completions"""
     
     activity = ActivityListSerializer(read_only=True)
@@ -423,7 +597,11 @@ class ActivityCompletionSerializer(serializers.ModelSerializer):
         session_id = validated_data.pop('session_id')
         
         try:
-            session = ActivitySession.objects.get(
+            # The completion's nested activity/category are serialized from this
+            # session, in list form: the detail-only JSON columns are not loaded
+            session = ActivitySession.objects.select_related('activity__category').defer(
+                *[f'activity__{column}' for column in Activity.DETAIL_ONLY_FIELDS]
+            ).get(
                 id=session_id,
                 user=self.context['request'].user
             )
@@ -431,56 +609,60 @@ class ActivityCompletionSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"session_id": "Invalid session ID"})
         
         # Set rewards
-        validated_data['user'] = self.context['request'].user
+        user = self.context['request'].user
+        points = session.activity.points_reward
+        coins = session.activity.coins_reward
+        validated_data['user'] = user
         validated_data['activity'] = session.activity
         validated_data['session'] = session
-        validated_data['points_earned'] = session.activity.points_reward
-        validated_data['coins_earned'] = session.activity.coins_reward
-        
-        # Create completion
-        completion = super().create(validated_data)
-        
-        # Update session status
-        session.status = 'completed'
-        session.completed_at = timezone.now()
-        session.save()
-        
-        # Update user stats
-        user = self.context['request'].user
-        user.total_points += completion.points_earned
-        user.coins += completion.coins_earned
+        validated_data['points_earned'] = points
+        validated_data['coins_earned'] = coins
         
-        # Update level
-        if user.total_points >= 3001:
-            user.current_level = 4
-        elif user.total_points >= 1501:
-            user.current_level = 3
-        elif user.total_points >= 501:
-            user.current_level = 2
-        else:
-            user.current_level = 1
-        
-        user.save()
-        
-        # Update streak
-        streak, created = Streak.objects.get_or_create(user=user)
-        streak.update_streak()
-        
-        # Create coin transaction
-        CoinTransaction.objects.create(
-            user=user,
-            transaction_type='earned_activity',
-            amount=completion.coins_earned,
-            balance_after=user.coins,
-            related_object_id=completion.activity.id,
-            related_object_type='activity',
-            description=f"Earned from completing {completion.activity.title_en}"
-        )
+        with transaction.atomic():
+            # Create completion
+            completion = super().create(validated_data)
+            
+            # Update session status
+            session.status = 'completed'
+            session.completed_at = timezone.now()
+            ActivitySession.objects.filter(pk=session.pk).update(
+                status=session.status, completed_at=session.completed_at
+            )
+            
+            # Update user stats in one UPDATE; current_level follows total_points
+            User.objects.filter(pk=user.pk).update(
+                total_points=F('total_points') + points,
+                coins=F('coins') + coins,
+                completions_count_30d=F('completions_count_30d') + 1
+            )
+            user.refresh_from_db(fields=['total_points', 'coins', 'current_level'])
+            
+            # Update streak
+            streak, created = Streak.objects.get_or_create(user=user)
+            streak.update_streak()
+            
+            # Create coin transaction
+            CoinTransaction.objects.create(
+                user=user,
+                transaction_type='earned_activity',
+                amount=completion.coins_earned,
+                balance_after=user.coins,
+                related_object_id=completion.activity.id,
+                related_object_type='activity',
+                description=f"Earned from completing {completion.activity.title_en}"
+            )
+            
+            # Activity analytics last, to hold the shared activity row's lock briefly
+            activity_totals = {'completion_count': F('completion_count') + 1}
+            if completion.rating:
+                activity_totals['rating_sum'] = F('rating_sum') + completion.rating
+                activity_totals['rating_count'] = F('rating_count') + 1
+            Activity.objects.filter(pk=completion.activity_id).update(**activity_totals)
         
         return completion
 
 
-class ActivityCompletionHistorySerializer(serializers.ModelSerializer):
+class ActivityCompletionHistorySerializer(CachedFieldsModelSerializer):
     """Serializer for viewing completion history"""
     
     activity = ActivityListSerializer(read_only=True)
@@ -497,7 +679,28 @@ class ActivityCompletionHistorySerializer(serializers.ModelSerializer):
 # GAMIFICATION SERIALIZERS
 # ============================================
 
-class StreakSerializer(serializers.ModelSerializer):
+def streak_cache_key(user_id, day):
+    # Dated, so yesterday's entry (and days_until_break) never outlives midnight
+    return f'streak:{user_id}:{day}'
+
+
+def invalidate_streak_cache(user_id):
+    """Drop today's cached streak representation for a user"""
+    cache.delete(streak_cache_key(user_id, timezone.localdate()))
+
+
+def overview_cache_key(user_id, day):
+    # Dated like the streak key: the week/month windows move at midnight
+    return f'progress_overview:{user_id}:{day}'
+
+
+def invalidate_overview_cache(*user_ids):
+    """Drop today's cached /progress/overview/ data for the given users"""
+    today = timezone.localdate()
+    cache.delete_many([overview_cache_key(user_id, today) for user_id in user_ids if user_id])
+
+
+class StreakSerializer(CachedFieldsModelSerializer):
     """Serializer for user streaks"""
     
     is_active = serializers.SerializerMethodField()
@@ -528,11 +731,28 @@ class StreakSerializer(serializers.ModelSerializer):
         return 1  # Have until tomorrow
 
 
-class BadgeSerializer(serializers.ModelSerializer):
+# Active catalogs shared by every user of a language; per-user flags are overlaid
+def badge_catalog_cache_key(lang):
+    return f'badge_catalog:v1:{lang}'
+
+
+def milestone_catalog_cache_key(lang):
+    return f'milestone_catalog:v1:{lang}'
+
+
+def invalidate_achievement_catalogs():
+    """Drop the cached badge and milestone catalogs"""
+    cache.delete_many([
+        key for lang in CATEGORY_LANGUAGES
+        for key in (badge_catalog_cache_key(lang), milestone_catalog_cache_key(lang))
+    ])
+
+
+class BadgeSerializer(LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Serializer for badges"""
     
-    name = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+    name = serializers.ReadOnlyField(source='name_en')
+    description = serializers.ReadOnlyField(source='description_en')
     is_unlocked = serializers.SerializerMethodField()
     
     class Meta:
@@ -542,24 +762,31 @@ class BadgeSerializer(serializers.ModelSerializer):
             'criteria', 'points_reward', 'coins_reward', 'rarity',
             'is_unlocked'
         ]
+        list_serializer_class = ContextPrefetchListSerializer
     
-    def get_name(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.name_hi if user and user.preferred_language == 'hi' else obj.name_en
+    localized_fields = ('name', 'description')
     
-    def get_description(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.description_hi if user and user.preferred_language == 'hi' else obj.description_en
+    def bulk_prefetch(self, instances):
+        if self._user:
+            self._unlocked_badge_ids()
+    
+    def _unlocked_badge_ids(self):
+        """The user's whole badge set, one query shared by every row"""
+        unlocked_badge_ids = self.context.get('unlocked_badge_ids')
+        if unlocked_badge_ids is None:
+            unlocked_badge_ids = self.context['unlocked_badge_ids'] = set(
+                UserBadge.objects.filter(user=self._user).values_list('badge_id', flat=True)
+            )
+        return unlocked_badge_ids
     
     def get_is_unlocked(self, obj):
         """Check if user has unlocked this badge"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            return UserBadge.objects.filter(user=user, badge=obj).exists()
-        return False
+        if not self._user:
+            return False
+        return obj.id in self._unlocked_badge_ids()
 
 
-class UserBadgeSerializer(serializers.ModelSerializer):
+class UserBadgeSerializer(CachedFieldsModelSerializer):
     """Serializer for user unlocked badges"""
     
     badge = BadgeSerializer(read_only=True)
@@ -569,11 +796,11 @@ class UserBadgeSerializer(serializers.ModelSerializer):
         fields = ['id', 'badge', 'unlocked_at', 'is_displayed']
 
 
-class MilestoneSerializer(serializers.ModelSerializer):
+class MilestoneSerializer(LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Serializer for milestones"""
     
-    name = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+    name = serializers.ReadOnlyField(source='name_en')
+    description = serializers.ReadOnlyField(source='description_en')
     is_achieved = serializers.SerializerMethodField()
     progress = serializers.SerializerMethodField()
     
@@ -584,47 +811,62 @@ class MilestoneSerializer(serializers.ModelSerializer):
             'criteria_value', 'points_reward', 'coins_reward',
             'is_achieved', 'progress'
         ]
+        list_serializer_class = ContextPrefetchListSerializer
     
-    def get_name(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.name_hi if user and user.preferred_language == 'hi' else obj.name_en
+    localized_fields = ('name', 'description')
     
-    def get_description(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.description_hi if user and user.preferred_language == 'hi' else obj.description_en
+    def bulk_prefetch(self, instances):
+        if self._user:
+            self._achieved_milestone_ids()
+            self._progress_values(self._user)
+    
+    def _achieved_milestone_ids(self):
+        """The user's whole milestone set, one query shared by every row"""
+        achieved_milestone_ids = self.context.get('achieved_milestone_ids')
+        if achieved_milestone_ids is None:
+            achieved_milestone_ids = self.context['achieved_milestone_ids'] = set(
+                UserMilestone.objects.filter(user=self._user).values_list('milestone_id', flat=True)
+            )
+        return achieved_milestone_ids
     
     def get_is_achieved(self, obj):
         """Check if user has achieved this milestone"""
-        user = self.context.get('request').user if self.context.get('request') else None
-        if user:
-            return UserMilestone.objects.filter(user=user, milestone=obj).exists()
-        return False
+        if not self._user:
+            return False
+        return obj.id in self._achieved_milestone_ids()
     
     def get_progress(self, obj):
         """Calculate progress towards milestone"""
-        user = self.context.get('request').user if self.context.get('request') else None
+        user = self._user
         if not user:
             return 0
         
-        if obj.milestone_type == 'activity_count':
-            current_value = ActivityCompletion.objects.filter(user=user).count()
-        elif obj.milestone_type == 'streak':
-            streak = Streak.objects.filter(user=user).first()
-            current_value = streak.longest_streak if streak else 0
-        elif obj.milestone_type == 'relationship_duration':
-            if user.relationship_start_date:
-                delta = timezone.now().date() - user.relationship_start_date
-                current_value = delta.days
-            else:
-                current_value = 0
-        else:
-            current_value = 0
-        
-        progress_percentage = (current_value / obj.criteria_value) * 100
-        return min(progress_percentage, 100)
+        current_value = self._progress_values(user).get(obj.milestone_type, 0)
+        return self.progress_percentage(current_value, obj.criteria_value)
+    
+    @staticmethod
+    def progress_percentage(current_value, criteria_value):
+        return min((current_value / criteria_value) * 100, 100)
+    
+    def _progress_values(self, user):
+        """User's current value per milestone type, computed once per serialization"""
+        progress_values = self.context.get('milestone_progress_values')
+        if progress_values is None:
+            longest_streak = Streak.objects.filter(user=user).values_list(
+                'longest_streak', flat=True
+            ).first()
+            progress_values = self.context['milestone_progress_values'] = {
+                'activity_count': ActivityCompletion.objects.filter(user=user).count(),
+                'streak': longest_streak or 0,
+                'relationship_duration': (
+                    (self._today - user.relationship_start_date).days
+                    if user.relationship_start_date else 0
+                ),
+            }
+        return progress_values
 
 
-class UserMilestoneSerializer(serializers.ModelSerializer):
+class UserMilestoneSerializer(CachedFieldsModelSerializer):
     """Serializer for achieved milestones"""
     
     milestone = MilestoneSerializer(read_only=True)
@@ -634,7 +876,7 @@ class UserMilestoneSerializer(serializers.ModelSerializer):
         fields = ['id', 'milestone', 'achieved_at', 'partner_also_achieved']
 
 
-class CoinTransactionSerializer(serializers.ModelSerializer):
+class CoinTransactionSerializer(CachedFieldsModelSerializer):
     """Serializer for coin transactions"""
     
     class Meta:
@@ -699,11 +941,11 @@ class BondScoreHistorySerializer(serializers.Serializer):
 # NOTIFICATION SERIALIZERS
 # ============================================
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(LocalizedFieldsMixin, CachedFieldsModelSerializer):
     """Serializer for notifications"""
     
-    title = serializers.SerializerMethodField()
-    message = serializers.SerializerMethodField()
+    title = serializers.ReadOnlyField(source='title_en')
+    message = serializers.ReadOnlyField(source='message_en')
     
     class Meta:
         model = Notification
@@ -713,13 +955,7 @@ class NotificationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'read_at']
     
-    def get_title(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.title_hi if user and user.preferred_language == 'hi' else obj.title_en
-    
-    def get_message(self, obj):
-        user = self.context.get('request').user if self.context.get('request') else None
-        return obj.message_hi if user and user.preferred_language == 'hi' else obj.message_en
+    localized_fields = ('title', 'message')
 
 
 # ============================================
@@ -7,22 +7,33 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Avg, Sum
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Q, F, Count, Avg, Sum, OuterRef, Subquery, Value, Exists, Case, When, BooleanField
+)
+from django.db.models.functions import Coalesce, ExtractWeekDay, Now
 from django.utils import timezone
 from django.core.cache import cache
 from datetime import timedelta, datetime
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
 from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_date
+from django.utils.http import parse_etags, quote_etag
+import hashlib
+import logging
 
 from bondingapp.models import (
     User, UserPreference, ActivityCategory, Activity,
     ActivitySession, ActivityCompletion, Streak, Badge,
     UserBadge, Milestone, UserMilestone, Notification,
-    CoinTransaction, SkipLimit
+    CoinTransaction, SkipLimit, BondScoreSnapshot, LEVEL_THRESHOLDS, new_invitation_code
 )
+from bondingapp.core.google_auth import verify_google_id_token
 from bondingapp.core.serializers import (
     UserSerializer, UserRegistrationSerializer, GoogleAuthSerializer,
     PartnerLinkSerializer, UserPreferenceSerializer,
@@ -32,16 +43,88 @@ from bondingapp.core.serializers import (
     UserBadgeSerializer, MilestoneSerializer, UserMilestoneSerializer,
     CoinTransactionSerializer, CoinSpendSerializer, NotificationSerializer,EmailLoginSerializer,
     ProgressOverviewSerializer, BondScoreHistorySerializer,
-    PartnerStatusSerializer, PartnerActivityStatusSerializer
+    PartnerStatusSerializer, PartnerActivityStatusSerializer, PartnerBasicSerializer,
+    streak_cache_key, overview_cache_key, categories_cache_key, daily_activities_cache_key,
+    badge_catalog_cache_key, milestone_catalog_cache_key, day_start, day_range
 )
+from bondingapp.core.renderers import ORJSONRenderer
+from bondingapp.tasks import notify_from_template
 from django.shortcuts import render
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+
+def notify_on_commit(user_id, template, params, data=None):
+    """
+    Queue a templated notification once the request's writes commit. The
+    response never depends on the broker: a failed publish is logged only.
+    """
+    def publish():
+        try:
+            notify_from_template.delay(str(user_id), template, params, data=data)
+        except Exception:
+            logger.exception(f"Could not queue {template} notification for {user_id}")
+    
+    transaction.on_commit(publish)
+
+
+def defer_unused_columns(queryset, serializer_class, user):
+    """Skip the columns `serializer_class` will not read for the user's language"""
+    return queryset.defer(*serializer_class.deferred_columns(user.preferred_language))
+
+
+def conditional_json_response(request, payload):
+    """
+    JSON response carrying an ETag, or a bodiless 304 when the client already
+    holds it. Clients revalidate every time, since payloads can change on edits.
+    `payload` is data to render or an already-rendered body.
+    """
+    body = payload if isinstance(payload, bytes) else ORJSONRenderer().render(payload)
+    etag = quote_etag(hashlib.md5(body, usedforsecurity=False).hexdigest())
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
 
 # ============================================
 # AUTHENTICATION VIEWSET
 # ============================================
 
+class LoginRateThrottle(AnonRateThrottle):
+    """Password hashing and token verification are costly by design: cap attempts per IP"""
+    scope = 'login'
+
+
+def set_online_status(user, is_online):
+    """Flip is_online with one narrow UPDATE instead of a full-row save"""
+    now = timezone.now()
+    values = {'is_online': is_online, 'last_active': now}
+    if is_online:
+        # Tokens are issued here, so simplejwt's UPDATE_LAST_LOGIN never applies
+        values['last_login'] = now
+    User.objects.filter(pk=user.pk).update(**values)
+    for field, value in values.items():
+        setattr(user, field, value)
+
+
+def issue_tokens(user):
+    """
+    Sign one refresh/access pair. The access token is derived from the refresh
+    claims, so the user's claims are built once and the outstanding-token row
+    the blacklist relies on is written once.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+    }
+
+
 class AuthViewSet(viewsets.GenericViewSet):
     """
     ViewSet for authentication operations
@@ -50,7 +133,10 @@ class AuthViewSet(viewsets.GenericViewSet):
     permission_classes = [AllowAny]
     serializer_class = GoogleAuthSerializer
     
-    @action(detail=False, methods=['post'], url_path='google-login')
+    @action(
+        detail=False, methods=['post'], url_path='google-login',
+        throttle_classes=[LoginRateThrottle]
+    )
     def google_login(self, request):
         """
         Google OAuth login/signup
@@ -63,12 +149,8 @@ class AuthViewSet(viewsets.GenericViewSet):
         google_token = serializer.validated_data['google_token']
         
         try:
-            # Verify Google token
-            idinfo = id_token.verify_oauth2_token(
-                google_token,
-                google_requests.Request(),
-                settings.GOOGLE_OAUTH_CLIENT_ID
-            )
+            # Verify Google token (certificates cached per process)
+            idinfo = verify_google_id_token(google_token)
             
             # Get user info from Google
             email = idinfo.get('email')
@@ -77,42 +159,37 @@ class AuthViewSet(viewsets.GenericViewSet):
             last_name = idinfo.get('family_name', '')
             profile_picture = idinfo.get('picture', '')
             
-            # Check if user exists
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={
-                    'username': email.split('@')[0],
-                    'google_id': google_id,
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'profile_picture': profile_picture,
-                }
-            )
-            
-            if created:
-                # New user - create preferences and generate invitation code
-                UserPreference.objects.create(user=user)
-                user.generate_invitation_code()
+            with transaction.atomic():
+                # Check if user exists (existing users come back with profile stats);
+                # a new user's invitation code goes into the INSERT itself
+                user, created = with_profile_stats(User.objects.all()).get_or_create(
+                    email=email,
+                    defaults={
+                        'username': email.split('@')[0],
+                        'google_id': google_id,
+                        'first_name': first_name,
+                        'last_name': last_name,
+                        'profile_picture': profile_picture,
+                        'partner_invitation_code': new_invitation_code,
+                    }
+                )
                 
-                # Create initial streak
-                Streak.objects.create(user=user)
+                if created:
+                    # New user - create preferences
+                    UserPreference.objects.create(user=user)
+                    
+                    # Create initial streak
+                    Streak.objects.create(user=user)
             
             # Update last login
-            user.is_online = True
-            user.save()
-            
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            set_online_status(user, True)
             
             return Response({
                 'success': True,
                 'message': 'Login successful',
                 'is_new_user': created,
                 'user': UserSerializer(user).data,
-                'tokens': {
-                    'access': str(refresh.access_token),
-                    'refresh': str(refresh),
-                }
+                'tokens': issue_tokens(user)
             }, status=status.HTTP_200_OK)
             
         except ValueError as e:
@@ -122,7 +199,7 @@ class AuthViewSet(viewsets.GenericViewSet):
                 'error': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
     
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], throttle_classes=[LoginRateThrottle])
     def register(self, request):
         """
         Manual registration (if needed)
@@ -132,20 +209,14 @@ class AuthViewSet(viewsets.GenericViewSet):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        # Generate tokens
-        refresh = RefreshToken.for_user(user)
-        
         return Response({
             'success': True,
             'message': 'Registration successful',
             'user': UserSerializer(user).data,
-            'tokens': {
-                'access': str(refresh.access_token),
-                'refresh': str(refresh),
-            }
+            'tokens': issue_tokens(user)
         }, status=status.HTTP_201_CREATED)
     
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], throttle_classes=[LoginRateThrottle])
     def login(self, request):
         """
         Email/Password login
@@ -162,8 +233,8 @@ class AuthViewSet(viewsets.GenericViewSet):
         password = serializer.validated_data['password']
         
         try:
-            # Get user by email
-            user = User.objects.get(email=email)
+            # Get user by email, with everything UserSerializer reads
+            user = with_profile_stats(User.objects.filter(email=email)).get()
             
             # Check password
             if not user.check_password(password):
@@ -182,21 +253,14 @@ class AuthViewSet(viewsets.GenericViewSet):
                 }, status=status.HTTP_403_FORBIDDEN)
             
             # Update user status
-            user.is_online = True
-            user.save()
-            
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            set_online_status(user, True)
             
             return Response({
                 'success': True,
                 'message': 'Login successful',
                 'message_hi': 'लॉगिन सफल',
                 'user': UserSerializer(user).data,
-                'tokens': {
-                    'access': str(refresh.access_token),
-                    'refresh': str(refresh),
-                }
+                'tokens': issue_tokens(user)
             }, status=status.HTTP_200_OK)
             
         except User.DoesNotExist:
@@ -215,8 +279,7 @@ class AuthViewSet(viewsets.GenericViewSet):
         """
         try:
             # Mark user as offline
-            request.user.is_online = False
-            request.user.save()
+            set_online_status(request.user, False)
             
             # Blacklist refresh token if provided
             refresh_token = request.data.get('refresh_token')
@@ -240,6 +303,36 @@ class AuthViewSet(viewsets.GenericViewSet):
 # USER VIEWSET
 # ============================================
 
+class PartnerLinkRateThrottle(UserRateThrottle):
+    """Invitation codes can be guessed by brute force: cap link attempts per user"""
+    scope = 'partner_link'
+
+
+def with_profile_stats(queryset):
+    """
+    Annotate what UserSerializer's bond score / streak fields read,
+    so serializing users costs no per-user queries
+    """
+    yesterday = timezone.now().date() - timedelta(days=1)
+    
+    # Same streak row as user.streak, counted only while still active
+    active_streak = Streak.objects.filter(
+        user_id=OuterRef('pk'), last_activity_date__gte=yesterday
+    ).values('current_streak')[:1]
+    
+    # Load only the partner columns PartnerBasicSerializer renders
+    partner_deferred = [
+        f'partner__{field.name}' for field in User._meta.concrete_fields
+        if field.name not in PartnerBasicSerializer.Meta.fields
+    ]
+    
+    return queryset.select_related('partner', 'preferences').defer(*partner_deferred).annotate(
+        _recent_completions=F('completions_count_30d'),
+        _partner_recent_completions=Coalesce(F('partner__completions_count_30d'), Value(0)),
+        _current_streak=Coalesce(Subquery(active_streak), Value(0))
+    )
+
+
 class UserViewSet(viewsets.ModelViewSet):
     """
     ViewSet for user operations
@@ -251,7 +344,7 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter to only show current user"""
-        return User.objects.filter(id=self.request.user.id)
+        return with_profile_stats(User.objects.filter(id=self.request.user.id))
     
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -259,7 +352,7 @@ class UserViewSet(viewsets.ModelViewSet):
         Get current user profile
         GET /api/users/me/
         """
-        serializer = UserSerializer(request.user, context={'request': request})
+        serializer = UserSerializer(self.get_queryset().get(), context={'request': request})
         return Response({
             'success': True,
             'user': serializer.data
@@ -272,7 +365,7 @@ class UserViewSet(viewsets.ModelViewSet):
         PUT/PATCH /api/users/update-profile/
         """
         serializer = UserSerializer(
-            request.user,
+            self.get_queryset().get(),
             data=request.data,
             partial=True,
             context={'request': request}
@@ -286,7 +379,10 @@ class UserViewSet(viewsets.ModelViewSet):
             'user': serializer.data
         })
     
-    @action(detail=False, methods=['post'], url_path='partner/link')
+    @action(
+        detail=False, methods=['post'], url_path='partner/link',
+        throttle_classes=[UserRateThrottle, PartnerLinkRateThrottle]
+    )
     def partner_link(self, request):
         """
         Link partner using invitation code
@@ -296,23 +392,15 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer = PartnerLinkSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        invitation_code = serializer.validated_data['invitation_code']
-        
         # Check if user already has a partner
-        if request.user.partner:
+        if request.user.partner_id:
             return Response({
                 'success': False,
                 'message': 'You already have a partner linked'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Find partner by invitation code
-        try:
-            partner = User.objects.get(partner_invitation_code=invitation_code)
-        except User.DoesNotExist:
-            return Response({
-                'success': False,
-                'message': 'Invalid invitation code'
-            }, status=status.HTTP_404_NOT_FOUND)
+        # Partner found by invitation code during validation
+        partner = serializer.context['partner_user']
         
         # Can't link to yourself
         if partner.id == request.user.id:
@@ -321,27 +409,31 @@ class UserViewSet(viewsets.ModelViewSet):
                 'message': 'Cannot link to yourself'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Check if partner already has a partner
-        if partner.partner:
+        # Link partners: one UPDATE for both rows, applied only while both are
+        # still unlinked, so concurrent links cannot double-book either user
+        with transaction.atomic():
+            linked = User.objects.filter(
+                pk__in=[request.user.pk, partner.pk], partner__isnull=True
+            ).update(partner=Case(
+                When(pk=request.user.pk, then=Value(partner.pk)),
+                default=Value(request.user.pk)
+            ))
+            if linked != 2:
+                transaction.set_rollback(True)
+        
+        if linked != 2:
             return Response({
                 'success': False,
                 'message': 'This user already has a partner'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Link partners
         request.user.partner = partner
         partner.partner = request.user
-        request.user.save()
-        partner.save()
         
         # Create notification for partner
-        Notification.objects.create(
-            user=partner,
-            notification_type='partner_joined',
-            title_en=f'{request.user.username} is now your partner!',
-            title_hi=f'{request.user.username} अब आपके साथी हैं!',
-            message_en=f'{request.user.username} has accepted your invitation.',
-            message_hi=f'{request.user.username} ने आपका निमंत्रण स्वीकार किया है।',
+        notify_on_commit(
+            partner.id, 'partner_joined',
+            {'username': request.user.username},
             data={'partner_id': str(request.user.id)}
         )
         
@@ -357,19 +449,17 @@ class UserViewSet(viewsets.ModelViewSet):
         Unlink partner
         DELETE /api/users/partner/unlink/
         """
-        if not request.user.partner:
+        if not request.user.partner_id:
             return Response({
                 'success': False,
                 'message': 'No partner to unlink'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        partner = request.user.partner
-        
-        # Unlink both users
+        # Unlink both users in one UPDATE (the partner only if still linked back)
+        User.objects.filter(
+            Q(pk=request.user.pk) | Q(pk=request.user.partner_id, partner_id=request.user.pk)
+        ).update(partner=None)
         request.user.partner = None
-        partner.partner = None
-        request.user.save()
-        partner.save()
         
         return Response({
             'success': True,
@@ -411,6 +501,29 @@ class UserViewSet(viewsets.ModelViewSet):
 # ACTIVITY VIEWSET
 # ============================================
 
+def with_activity_flags(queryset, user, today):
+    """
+    Annotate the per-user is_unlocked / is_completed_today flags the
+    activity serializers render, as EXISTS subqueries in the same SELECT
+    """
+    completions = ActivityCompletion.objects.filter(user=user, activity=OuterRef('pk'))
+    start, end = day_range(today)
+    return queryset.annotate(
+        _is_unlocked=Case(
+            When(is_premium=False, then=Value(True)),
+            default=Exists(completions),
+            output_field=BooleanField()
+        ),
+        _is_completed_today=Exists(completions.filter(completed_at__gte=start, completed_at__lt=end))
+    )
+
+
+class ActivityPagination(LimitOffsetPagination):
+    """Bounded activity pages: ?limit=&offset="""
+    default_limit = 50
+    max_limit = 200
+
+
 class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for activities
@@ -418,6 +531,7 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
     """
     queryset = Activity.objects.filter(is_active=True)
     permission_classes = [IsAuthenticated]
+    pagination_class = ActivityPagination
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -425,41 +539,63 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         return ActivityListSerializer
     
     def get_queryset(self):
-        queryset = Activity.objects.filter(is_active=True)
+        params = self.request.query_params
+        filters = Q(is_active=True)
         
         # Filter by category
-        category_id = self.request.query_params.get('category')
+        category_id = params.get('category')
         if category_id:
-            queryset = queryset.filter(category_id=category_id)
+            filters &= Q(category_id=category_id)
         
         # Filter by difficulty
-        difficulty = self.request.query_params.get('difficulty')
+        difficulty = params.get('difficulty')
         if difficulty:
-            queryset = queryset.filter(difficulty=difficulty)
+            filters &= Q(difficulty=difficulty)
         
         # Filter by mode
-        mode = self.request.query_params.get('mode')
+        mode = params.get('mode')
         if mode:
-            queryset = queryset.filter(Q(mode=mode) | Q(mode='both'))
+            filters &= Q(mode=mode) | Q(mode='both')
         
         # Filter premium
-        show_premium = self.request.query_params.get('premium', 'true').lower() == 'true'
+        show_premium = params.get('premium', 'true').lower() == 'true'
         if not show_premium:
-            queryset = queryset.filter(is_premium=False)
+            filters &= Q(is_premium=False)
+        
+        # One filter() call: a single WHERE matching activity_list_idx
+        queryset = Activity.objects.filter(filters)
+        
+        if self.action in ('list', 'retrieve'):
+            queryset = defer_unused_columns(queryset, self.get_serializer_class(), self.request.user)
+        elif self.action == 'start':
+            # The session payload nests the list form; both titles feed the notification
+            queryset = queryset.for_list()
+        if self.action in ('list', 'retrieve', 'start'):
+            queryset = with_activity_flags(queryset, self.request.user, timezone.localdate())
         
         return queryset.select_related('category')
     
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['today'] = timezone.localdate()
+        return context
+    
     def list(self, request, *args, **kwargs):
         """
         List all activities
         GET /api/activities/
+        Query params: ?limit=50&offset=0
         """
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        # Stable order so offsets page consistently
+        page = self.paginate_queryset(self.get_queryset().order_by('pk'))
+        serializer = self.get_serializer(page, many=True)
         
+        # count is a SELECT COUNT(*) over the filters, not the serialized length
         return Response({
             'success': True,
-            'count': len(serializer.data),
+            'count': self.paginator.count,
+            'next': self.paginator.get_next_link(),
+            'previous': self.paginator.get_previous_link(),
             'activities': serializer.data
         })
     
@@ -482,35 +618,45 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         Get today's featured activities
         GET /api/activities/daily/
         """
-        # Try to get from cache first
-        cache_key = f'daily_activities_{request.user.preferred_language}'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return Response({
-                'success': True,
-                'activities': cached_data
-            })
-        
-        # Get daily featured activities
-        daily_activities = Activity.objects.filter(
-            is_active=True,
-            is_daily_featured=True
-        ).select_related('category')[:5]
-        
-        serializer = ActivityListSerializer(
-            daily_activities,
-            many=True,
-            context={'request': request}
-        )
-        
-        # Cache for 1 hour
-        cache.set(cache_key, serializer.data, 3600)
+        lang = request.user.preferred_language
+        cache_key = daily_activities_cache_key(lang)
+        activities = cache.get(cache_key)
+        
+        if activities is None:
+            daily_activities = defer_unused_columns(
+                Activity.objects.filter(is_active=True, is_daily_featured=True),
+                ActivityListSerializer, request.user
+            ).select_related('category')[:5]
+            activities = ActivityListSerializer(
+                daily_activities,
+                many=True,
+                context=self.get_serializer_context()
+            ).data
+            cache.set(cache_key, activities, settings.CACHE_TTL['DAILY_ACTIVITIES'])
+        
+        # The cached payload is shared per language; the two per-user flags are not
+        flags = {}
+        if activities:
+            flags = {
+                str(pk): (unlocked, completed_today)
+                for pk, unlocked, completed_today in with_activity_flags(
+                    Activity.objects.filter(pk__in=[activity['id'] for activity in activities]),
+                    request.user, timezone.localdate()
+                ).values_list('pk', '_is_unlocked', '_is_completed_today')
+            }
+        activities = [
+            dict(
+                activity,
+                is_unlocked=flags.get(activity['id'], (not activity['is_premium'], False))[0],
+                is_completed_today=flags.get(activity['id'], (False, False))[1]
+            )
+            for activity in activities
+        ]
         
-        return Response({
+        return conditional_json_response(request, {
             'success': True,
-            'count': len(serializer.data),
-            'activities': serializer.data
+            'count': len(activities),
+            'activities': activities
         })
     
     @action(detail=False, methods=['get'])
@@ -519,30 +665,25 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         Get all activity categories
         GET /api/activities/categories/
         """
-        cache_key = f'categories_{request.user.preferred_language}'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return Response({
+        # Identical for every user of a language: cache the rendered body
+        cache_key = categories_cache_key(request.user.preferred_language)
+        body = cache.get(cache_key)
+        
+        if body is None:
+            categories = ActivityCategory.objects.filter(is_active=True)
+            data = ActivityCategorySerializer(
+                categories,
+                many=True,
+                context={'request': request}
+            ).data
+            body = ORJSONRenderer().render({
                 'success': True,
-                'categories': cached_data
+                'count': len(data),
+                'categories': data
             })
+            cache.set(cache_key, body, settings.CACHE_TTL['CATEGORIES'])
         
-        categories = ActivityCategory.objects.filter(is_active=True)
-        serializer = ActivityCategorySerializer(
-            categories,
-            many=True,
-            context={'request': request}
-        )
-        
-        # Cache for 24 hours
-        cache.set(cache_key, serializer.data, 86400)
-        
-        return Response({
-            'success': True,
-            'count': len(serializer.data),
-            'categories': serializer.data
-        })
+        return conditional_json_response(request, body)
     
     @action(detail=True, methods=['post'])
     def start(self, request, pk=None):
@@ -554,14 +695,9 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         activity = self.get_object()
         mode = request.data.get('mode', 'solo')
         
-        # Check if activity is premium and unlocked
+        # Check if activity is premium and unlocked (annotated by get_queryset)
         if activity.is_premium:
-            is_unlocked = ActivityCompletion.objects.filter(
-                user=request.user,
-                activity=activity
-            ).exists()
-            
-            if not is_unlocked and request.user.coins < activity.unlock_cost_coins:
+            if not activity._is_unlocked and request.user.coins < activity.unlock_cost_coins:
                 return Response({
                     'success': False,
                     'message': 'Insufficient coins to unlock this activity',
@@ -569,40 +705,34 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
                     'your_coins': request.user.coins
                 }, status=status.HTTP_402_PAYMENT_REQUIRED)
         
-        # Check if already in progress
-        existing_session = ActivitySession.objects.filter(
-            user=request.user,
-            activity=activity,
-            status__in=['started', 'in_progress']
-        ).first()
+        # Reuse the open session if there is one; activity_session_active_uniq
+        # makes concurrent starts converge on a single row
+        with transaction.atomic():
+            session, created = ActivitySession.objects.get_or_create(
+                user=request.user,
+                activity=activity,
+                status__in=['started', 'in_progress'],
+                defaults={'mode': mode, 'status': 'started'}
+            )
+        session.activity = activity
+        serializer = ActivitySessionSerializer(session)
         
-        if existing_session:
-            serializer = ActivitySessionSerializer(existing_session)
+        if not created:
             return Response({
                 'success': True,
                 'message': 'Activity already in progress',
                 'session': serializer.data
             })
         
-        # Create new session
-        session = ActivitySession.objects.create(
-            user=request.user,
-            activity=activity,
-            mode=mode,
-            status='started'
-        )
-        
-        serializer = ActivitySessionSerializer(session)
-        
         # Notify partner if together mode
-        if mode == 'together' and request.user.partner:
-            Notification.objects.create(
-                user=request.user.partner,
-                notification_type='partner_activity',
-                title_en=f'{request.user.username} started an activity',
-                title_hi=f'{request.user.username} ने एक गतिविधि शुरू की',
-                message_en=f'Join them in "{activity.title_en}"',
-                message_hi=f'उनके साथ "{activity.title_hi}" में शामिल हों',
+        if mode == 'together' and request.user.partner_id:
+            notify_on_commit(
+                request.user.partner_id, 'partner_activity_started',
+                {
+                    'username': request.user.username,
+                    'activity_en': activity.title_en,
+                    'activity_hi': activity.title_hi,
+                },
                 data={'activity_id': str(activity.id), 'session_id': str(session.id)}
             )
         
@@ -635,14 +765,14 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         completion = serializer.save()
         
         # Notify partner
-        if request.user.partner:
-            Notification.objects.create(
-                user=request.user.partner,
-                notification_type='partner_activity',
-                title_en=f'{request.user.username} completed an activity',
-                title_hi=f'{request.user.username} ने एक गतिविधि पूरी की',
-                message_en=f'They completed "{activity.title_en}"',
-                message_hi=f'उन्होंने "{activity.title_hi}" पूरा किया',
+        if request.user.partner_id:
+            notify_on_commit(
+                request.user.partner_id, 'partner_activity_completed',
+                {
+                    'username': request.user.username,
+                    'activity_en': activity.title_en,
+                    'activity_hi': activity.title_hi,
+                },
                 data={'activity_id': str(activity.id), 'completion_id': str(completion.id)}
             )
         
@@ -666,32 +796,34 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
         POST /api/activities/{id}/skip/
         """
         activity = self.get_object()
-        today = timezone.now().date()
-        
-        # Check skip limit
-        skip_limit, created = SkipLimit.objects.get_or_create(
-            user=request.user,
-            date=today
-        )
-        
-        if not skip_limit.can_skip():
-            return Response({
-                'success': False,
-                'message': f'Daily skip limit reached ({skip_limit.max_skips_per_day} skips per day)',
-                'skips_used': skip_limit.skips_used,
-                'max_skips': skip_limit.max_skips_per_day
-            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+        today = timezone.localdate()
         
-        # Increment skip counter
-        skip_limit.skips_used += 1
-        skip_limit.save()
-        
-        # Update any active session
-        ActivitySession.objects.filter(
-            user=request.user,
-            activity=activity,
-            status__in=['started', 'in_progress']
-        ).update(status='skipped')
+        with transaction.atomic():
+            # Lock today's row so concurrent skips cannot both pass the limit
+            skip_limit, created = SkipLimit.objects.select_for_update().get_or_create(
+                user=request.user,
+                date=today
+            )
+            
+            # A row created just now has every skip left (and no remaining_skips loaded yet)
+            if not created and not skip_limit.can_skip():
+                return Response({
+                    'success': False,
+                    'message': f'Daily skip limit reached ({skip_limit.max_skips_per_day} skips per day)',
+                    'skips_used': skip_limit.skips_used,
+                    'max_skips': skip_limit.max_skips_per_day
+                }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            
+            # Increment skip counter in SQL, without rewriting the row
+            SkipLimit.objects.filter(pk=skip_limit.pk).update(skips_used=F('skips_used') + 1)
+            skip_limit.skips_used += 1
+            
+            # Update any active session
+            ActivitySession.objects.filter(
+                user=request.user,
+                activity=activity,
+                status__in=['started', 'in_progress']
+            ).update(status='skipped')
         
         return Response({
             'success': True,
@@ -704,6 +836,14 @@ class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
 # PROGRESS VIEWSET
 # ============================================
 
+class HistoryCursorPagination(CursorPagination):
+    """Newest-first completion pages: ?limit=&cursor="""
+    ordering = '-completed_at'
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
 class ProgressViewSet(viewsets.GenericViewSet):
     """
     ViewSet for progress and statistics
@@ -718,20 +858,35 @@ class ProgressViewSet(viewsets.GenericViewSet):
         GET /api/progress/overview/
         """
         user = request.user
-        today = timezone.now().date()
+        today = timezone.localdate()
+        key = overview_cache_key(user.pk, today)
+        data = cache.get(key)
+        if data is None:
+            data = self._overview_data(user, today)
+            cache.set(key, data, settings.CACHE_TTL['OVERVIEW'])
+        
+        # Balances come from the freshly authenticated user row, not the cache
+        return Response({
+            'success': True,
+            'overview': dict(
+                data,
+                total_points=user.total_points,
+                total_coins=user.coins,
+                current_level=user.current_level
+            )
+        })
+    
+    def _overview_data(self, user, today):
+        """Aggregate the overview counters (about eight queries) as of local day `today`"""
         week_ago = today - timedelta(days=7)
         month_ago = today - timedelta(days=30)
         
-        # Get activity counts
-        total_activities = ActivityCompletion.objects.filter(user=user).count()
-        activities_this_week = ActivityCompletion.objects.filter(
-            user=user,
-            completed_at__date__gte=week_ago
-        ).count()
-        activities_this_month = ActivityCompletion.objects.filter(
-            user=user,
-            completed_at__date__gte=month_ago
-        ).count()
+        # Get activity counts (one scan of the user's completions)
+        counts = ActivityCompletion.objects.filter(user=user).aggregate(
+            total=Count('id'),
+            week=Count('id', filter=Q(completed_at__gte=day_start(week_ago))),
+            month=Count('id', filter=Q(completed_at__gte=day_start(month_ago)))
+        )
         
         # Bond score
         bond_score = user.calculate_bond_score()
@@ -757,51 +912,49 @@ class ProgressViewSet(viewsets.GenericViewSet):
         favorite_category_name = favorite_category['activity__category__name_en'] if favorite_category else 'None'
         
         # Most active day
-        most_active_day = ActivityCompletion.objects.filter(user=user).extra(
-            select={'day': 'strftime("%%w", completed_at)'}
+        most_active_day = ActivityCompletion.objects.filter(user=user).annotate(
+            day=ExtractWeekDay('completed_at')
         ).values('day').annotate(count=Count('id')).order_by('-count').first()
         
+        # ExtractWeekDay counts 1 (Sunday) to 7 (Saturday)
         days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        most_active_day_name = days[int(most_active_day['day'])] if most_active_day else 'None'
+        most_active_day_name = days[most_active_day['day'] - 1] if most_active_day else 'None'
         
         # Partner sync rate
+        # Share of this month's distinct activities the partner also did,
+        # counted in SQL instead of intersecting two id sets in Python
         partner_sync_rate = 0
-        if user.partner:
-            user_completions = set(ActivityCompletion.objects.filter(
+        if user.partner_id:
+            partner_also_did = ActivityCompletion.objects.filter(
+                user_id=user.partner_id,
+                activity=OuterRef('activity'),
+                completed_at__gte=day_start(month_ago)
+            )
+            sync = ActivityCompletion.objects.filter(
                 user=user,
-                completed_at__date__gte=month_ago
-            ).values_list('activity_id', flat=True))
-            
-            partner_completions = set(ActivityCompletion.objects.filter(
-                user=user.partner,
-                completed_at__date__gte=month_ago
-            ).values_list('activity_id', flat=True))
+                completed_at__gte=day_start(month_ago)
+            ).aggregate(
+                done=Count('activity', distinct=True),
+                shared=Count('activity', distinct=True, filter=Exists(partner_also_did))
+            )
             
-            if user_completions:
-                partner_sync_rate = len(user_completions & partner_completions) / len(user_completions) * 100
+            if sync['done']:
+                partner_sync_rate = sync['shared'] / sync['done'] * 100
         
-        data = {
-            'total_activities_completed': total_activities,
-            'activities_this_week': activities_this_week,
-            'activities_this_month': activities_this_month,
+        return {
+            'total_activities_completed': counts['total'],
+            'activities_this_week': counts['week'],
+            'activities_this_month': counts['month'],
             'bond_score': bond_score,
             'bond_score_change': bond_score_change,
             'current_streak': current_streak,
             'longest_streak': longest_streak,
-            'total_points': user.total_points,
-            'total_coins': user.coins,
-            'current_level': user.current_level,
             'badges_unlocked': badges_unlocked,
             'milestones_achieved': milestones_achieved,
             'favorite_category': favorite_category_name,
             'most_active_day': most_active_day_name,
             'partner_sync_rate': round(partner_sync_rate, 2)
         }
-        
-        return Response({
-            'success': True,
-            'overview': data
-        })
     
     @action(detail=False, methods=['get'])
     def streak(self, request):
@@ -809,12 +962,16 @@ class ProgressViewSet(viewsets.GenericViewSet):
         Get current streak information
         GET /api/progress/streak/
         """
-        streak, created = Streak.objects.get_or_create(user=request.user)
-        serializer = StreakSerializer(streak)
+        key = streak_cache_key(request.user.pk, timezone.localdate())
+        data = cache.get(key)
+        if data is None:
+            streak, created = Streak.objects.get_or_create(user=request.user)
+            data = StreakSerializer(streak).data
+            cache.set(key, data, settings.CACHE_TTL['STREAK'])
         
         return Response({
             'success': True,
-            'streak': serializer.data
+            'streak': data
         })
     
     @action(detail=False, methods=['get'], url_path='bond-score')
@@ -823,24 +980,30 @@ class ProgressViewSet(viewsets.GenericViewSet):
         Get bond score history
         GET /api/progress/bond-score/
         """
-        # Get last 30 days of bond score
-        # For simplicity, calculating current bond score
-        # In production, you'd store daily snapshots
-        
+        # Last 30 days from the nightly snapshots, then today's live score
+        today = timezone.localdate()
         current_score = request.user.calculate_bond_score()
         
-        history = [
-            {
-                'date': timezone.now().date(),
-                'score': current_score
-            }
-        ]
+        history = list(BondScoreSnapshot.objects.filter(
+            user=request.user,
+            date__gte=today - timedelta(days=30),
+            date__lt=today
+        ).values('date', 'score'))
+        history.append({'date': today, 'score': current_score})
+        
+        first_score = history[0]['score']
+        if current_score > first_score:
+            trend = 'up'
+        elif current_score < first_score:
+            trend = 'down'
+        else:
+            trend = 'stable'
         
         return Response({
             'success': True,
             'current_score': current_score,
             'history': history,
-            'trend': 'stable'  # Can be 'up', 'down', 'stable'
+            'trend': trend
         })
     
     @action(detail=False, methods=['get'])
@@ -849,30 +1012,81 @@ class ProgressViewSet(viewsets.GenericViewSet):
         Get all badges and milestones
         GET /api/progress/achievements/
         """
-        # Unlocked badges
-        user_badges = UserBadge.objects.filter(user=request.user).select_related('badge')
-        unlocked_badges = UserBadgeSerializer(user_badges, many=True).data
+        user_badges = list(UserBadge.objects.filter(user=request.user).select_related('badge'))
+        user_milestones = list(UserMilestone.objects.filter(user=request.user).select_related('milestone'))
+        
+        # One context for all four serializers: the nested badge/milestone rows
+        # render is_unlocked, is_achieved and progress from the same sets and
+        # progress values as the full lists, with no further queries
+        context = {
+            'request': request,
+            'unlocked_badge_ids': {user_badge.badge_id for user_badge in user_badges},
+            'achieved_milestone_ids': {
+                user_milestone.milestone_id for user_milestone in user_milestones
+            },
+        }
         
-        # All badges (to show locked ones)
-        all_badges = Badge.objects.filter(is_active=True)
-        all_badges_data = BadgeSerializer(
-            all_badges,
-            many=True,
-            context={'request': request}
-        ).data
+        # Unlocked badges
+        unlocked_badges = UserBadgeSerializer(user_badges, many=True, context=context).data
+        
+        # All badges (to show locked ones): the catalog is shared per language,
+        # only is_unlocked is the user's
+        lang = request.user.preferred_language
+        badge_catalog = cache.get(badge_catalog_cache_key(lang))
+        if badge_catalog is None:
+            badge_catalog = BadgeSerializer(
+                defer_unused_columns(
+                    Badge.objects.filter(is_active=True), BadgeSerializer, request.user
+                ),
+                many=True,
+                context={'request': request, 'unlocked_badge_ids': set()}
+            ).data
+            cache.set(
+                badge_catalog_cache_key(lang), badge_catalog,
+                settings.CACHE_TTL['ACHIEVEMENT_CATALOG']
+            )
+        unlocked_ids = {str(badge_id) for badge_id in context['unlocked_badge_ids']}
+        all_badges_data = [
+            dict(badge, is_unlocked=badge['id'] in unlocked_ids) for badge in badge_catalog
+        ]
         
         # Achieved milestones
-        user_milestones = UserMilestone.objects.filter(user=request.user).select_related('milestone')
-        achieved_milestones = UserMilestoneSerializer(user_milestones, many=True).data
-        
-        # All milestones
-        all_milestones = Milestone.objects.filter(is_active=True)
-        all_milestones_data = MilestoneSerializer(
-            all_milestones,
-            many=True,
-            context={'request': request}
+        achieved_milestones = UserMilestoneSerializer(
+            user_milestones, many=True, context=context
         ).data
         
+        # All milestones: shared catalog, with the user's is_achieved and progress
+        milestone_catalog = cache.get(milestone_catalog_cache_key(lang))
+        if milestone_catalog is None:
+            milestone_catalog = MilestoneSerializer(
+                defer_unused_columns(
+                    Milestone.objects.filter(is_active=True), MilestoneSerializer, request.user
+                ),
+                many=True,
+                context={
+                    'request': request,
+                    'achieved_milestone_ids': set(),
+                    'milestone_progress_values': {}
+                }
+            ).data
+            cache.set(
+                milestone_catalog_cache_key(lang), milestone_catalog,
+                settings.CACHE_TTL['ACHIEVEMENT_CATALOG']
+            )
+        achieved_ids = {str(milestone_id) for milestone_id in context['achieved_milestone_ids']}
+        progress_values = MilestoneSerializer(context=context)._progress_values(request.user)
+        all_milestones_data = [
+            dict(
+                milestone,
+                is_achieved=milestone['id'] in achieved_ids,
+                progress=MilestoneSerializer.progress_percentage(
+                    progress_values.get(milestone['milestone_type'], 0),
+                    milestone['criteria_value']
+                )
+            )
+            for milestone in milestone_catalog
+        ]
+        
         return Response({
             'success': True,
             'badges': {
@@ -894,35 +1108,60 @@ class ProgressViewSet(viewsets.GenericViewSet):
         """
         Get activity completion history
         GET /api/progress/history/
-        Query params: ?limit=20&offset=0&date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
+        Query params: ?limit=20&cursor=...&date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
+        
+        Cursor-paged: `next`/`previous` are page URLs (or null) rather than
+        booleans, and there is no total `count`; `offset` is no longer read.
+        An unparseable date_from/date_to is a 400.
         """
+        # The nested activity is rendered without request context, i.e. in English;
+        # skip its (and its category's) Hindi and detail-only columns, and the
+        # completion's own unrendered feedback text. Activity and category are
+        # the serializer's only relations, so every page is one query.
         queryset = ActivityCompletion.objects.filter(
             user=request.user
-        ).select_related('activity', 'activity__category')
+        ).select_related('activity', 'activity__category').defer(
+            'feedback',
+            *[f'activity__{column}' for column in ActivityListSerializer.deferred_columns('en')],
+            *[
+                f'activity__category__{column}'
+                for column in ActivityCategorySerializer.deferred_columns('en')
+            ]
+        )
         
         # Date filters
         date_from = request.query_params.get('date_from')
         date_to = request.query_params.get('date_to')
         
+        # parse_date() returns None for malformed input and raises ValueError
+        # for well-formed but impossible dates (e.g. 2024-02-30)
+        try:
+            parsed_from = date_from and parse_date(date_from)
+            parsed_to = date_to and parse_date(date_to)
+        except ValueError:
+            parsed_from = parsed_to = None
+        if (date_from and not parsed_from) or (date_to and not parsed_to):
+            return Response({
+                'success': False,
+                'message': 'Invalid date'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        date_from, date_to = parsed_from, parsed_to
+        
         if date_from:
-            queryset = queryset.filter(completed_at__date__gte=date_from)
+            queryset = queryset.filter(completed_at__gte=day_start(date_from))
         if date_to:
-            queryset = queryset.filter(completed_at__date__lte=date_to)
-        
-        # Pagination
-        limit = int(request.query_params.get('limit', 20))
-        offset = int(request.query_params.get('offset', 0))
+            queryset = queryset.filter(completed_at__lt=day_start(date_to + timedelta(days=1)))
         
-        total_count = queryset.count()
-        completions = queryset[offset:offset + limit]
+        # Cursor pagination: a range scan on (user, completed_at), no COUNT(*)
+        paginator = HistoryCursorPagination()
+        completions = paginator.paginate_queryset(queryset, request, view=self)
         
         serializer = ActivityCompletionHistorySerializer(completions, many=True)
         
         return Response({
             'success': True,
-            'count': total_count,
-            'next': offset + limit < total_count,
-            'previous': offset > 0,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
             'history': serializer.data
         })
 
@@ -931,6 +1170,15 @@ class ProgressViewSet(viewsets.GenericViewSet):
 # REWARDS VIEWSET
 # ============================================
 
+LEVEL_NAMES = ('Beginner', 'Growing', 'Strong', 'Unbreakable')
+
+# Built once from the thresholds current_level is generated from
+LEVEL_TABLE = {
+    level: {'name': name, 'min': low, 'max': high}
+    for level, (name, (low, high)) in enumerate(zip(LEVEL_NAMES, LEVEL_THRESHOLDS), start=1)
+}
+
+
 class RewardViewSet(viewsets.GenericViewSet):
     """
     ViewSet for rewards and gamification
@@ -946,8 +1194,10 @@ class RewardViewSet(viewsets.GenericViewSet):
         """
         user = request.user
         
-        # Get recent transactions
-        transactions = CoinTransaction.objects.filter(user=user)[:20]
+        # Get recent transactions, loading only the columns the serializer renders
+        transactions = CoinTransaction.objects.filter(user=user).only(
+            *CoinTransactionSerializer.Meta.fields
+        )[:20]
         transaction_data = CoinTransactionSerializer(transactions, many=True).data
         
         return Response({
@@ -978,26 +1228,33 @@ class RewardViewSet(viewsets.GenericViewSet):
         cost = serializer.validated_data['cost']
         item_id = serializer.validated_data.get('item_id')
         
-        # Deduct coins
-        user.coins -= cost
-        user.save()
-        
-        # Create transaction
-        transaction = CoinTransaction.objects.create(
-            user=user,
-            transaction_type=f'spent_{item_type}',
-            amount=-cost,
-            balance_after=user.coins,
-            related_object_id=item_id,
-            related_object_type=item_type,
-            description=f'Spent on {item_type}'
-        )
+        with transaction.atomic():
+            # Deduct coins in SQL; the balance check is repeated in the WHERE
+            # so concurrent spends cannot overdraw
+            spent = User.objects.filter(pk=user.pk, coins__gte=cost).update(coins=F('coins') - cost)
+            if not spent:
+                return Response({
+                    'success': False,
+                    'message': 'Insufficient coins'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            user.refresh_from_db(fields=['coins'])
+            
+            # Create transaction
+            coin_transaction = CoinTransaction.objects.create(
+                user=user,
+                transaction_type=f'spent_{item_type}',
+                amount=-cost,
+                balance_after=user.coins,
+                related_object_id=item_id,
+                related_object_type=item_type,
+                description=f'Spent on {item_type}'
+            )
         
         return Response({
             'success': True,
             'message': 'Coins spent successfully',
             'new_balance': user.coins,
-            'transaction': CoinTransactionSerializer(transaction).data
+            'transaction': CoinTransactionSerializer(coin_transaction).data
         })
     
     @action(detail=False, methods=['get'])
@@ -1007,15 +1264,7 @@ class RewardViewSet(viewsets.GenericViewSet):
         GET /api/rewards/levels/
         """
         user = request.user
-        
-        level_thresholds = {
-            1: {'name': 'Beginner', 'min': 0, 'max': 500},
-            2: {'name': 'Growing', 'min': 501, 'max': 1500},
-            3: {'name': 'Strong', 'min': 1501, 'max': 3000},
-            4: {'name': 'Unbreakable', 'min': 3001, 'max': None}
-        }
-        
-        current_level_info = level_thresholds[user.current_level]
+        current_level_info = LEVEL_TABLE[user.current_level]
         
         # Calculate progress to next level
         if current_level_info['max']:
@@ -1036,7 +1285,7 @@ class RewardViewSet(viewsets.GenericViewSet):
             'progress_percentage': round(progress, 2),
             'points_to_next_level': points_to_next,
             'next_level': next_level,
-            'all_levels': level_thresholds
+            'all_levels': LEVEL_TABLE
         })
     
     @action(detail=False, methods=['post'], url_path='claim-daily-bonus')
@@ -1046,41 +1295,37 @@ class RewardViewSet(viewsets.GenericViewSet):
         POST /api/rewards/claim-daily-bonus/
         """
         user = request.user
-        today = timezone.now().date()
-        
-        # Check if already claimed today
-        already_claimed = CoinTransaction.objects.filter(
-            user=user,
-            transaction_type='earned_daily_bonus',
-            created_at__date=today
-        ).exists()
+        bonus_coins = 5
         
-        if already_claimed:
+        # unique_daily_bonus rejects a second claim for the same day, so a
+        # duplicate rolls back the credit instead of needing a prior check
+        try:
+            with transaction.atomic():
+                # Award bonus
+                User.objects.filter(pk=user.pk).update(coins=F('coins') + bonus_coins)
+                user.refresh_from_db(fields=['coins'])
+                
+                # Create transaction
+                coin_transaction = CoinTransaction.objects.create(
+                    user=user,
+                    transaction_type='earned_daily_bonus',
+                    amount=bonus_coins,
+                    balance_after=user.coins,
+                    description='Daily login bonus',
+                    claim_date=timezone.localdate()
+                )
+        except IntegrityError:
             return Response({
                 'success': False,
                 'message': 'Daily bonus already claimed today'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Award bonus
-        bonus_coins = 5
-        user.coins += bonus_coins
-        user.save()
-        
-        # Create transaction
-        transaction = CoinTransaction.objects.create(
-            user=user,
-            transaction_type='earned_daily_bonus',
-            amount=bonus_coins,
-            balance_after=user.coins,
-            description='Daily login bonus'
-        )
-        
         return Response({
             'success': True,
             'message': 'Daily bonus claimed',
             'coins_earned': bonus_coins,
             'new_balance': user.coins,
-            'transaction': CoinTransactionSerializer(transaction).data
+            'transaction': CoinTransactionSerializer(coin_transaction).data
         })
 
 
@@ -1110,25 +1355,46 @@ class PartnerViewSet(viewsets.GenericViewSet):
                 'has_partner': False
             })
         
+        # The partner row itself came with request.user (select_related)
         partner = user.partner
-        today = timezone.now().date()
-        
-        # Partner's current activity
-        current_activity = ActivitySession.objects.filter(
-            user=partner,
-            status__in=['started', 'in_progress']
-        ).select_related('activity').first()
-        
-        current_activity_title = current_activity.activity.title_en if current_activity else None
-        
-        # Activities completed today
-        activities_today = ActivityCompletion.objects.filter(
-            user=partner,
-            completed_at__date=today
-        ).count()
-        
-        # Current streak
-        partner_streak = partner.get_current_streak()
+        today_start, today_end = day_range(timezone.localdate())
+        # Streak dates are written by update_streak() on the UTC calendar
+        streak_since = timezone.now().date() - timedelta(days=1)
+        
+        # Current activity title, today's completion count and the active streak
+        # as three scalar subqueries of one SELECT
+        stats = User.objects.filter(pk=partner.pk).values(
+            partner_current_activity=Subquery(
+                ActivitySession.objects.filter(
+                    user_id=OuterRef('pk'),
+                    status__in=['started', 'in_progress']
+                ).values('activity__title_en')[:1]
+            ),
+            partner_activities_today=Coalesce(
+                Subquery(
+                    ActivityCompletion.objects.filter(
+                        user_id=OuterRef('pk'),
+                        completed_at__gte=today_start,
+                        completed_at__lt=today_end
+                    ).order_by().values('user_id').annotate(total=Count('pk')).values('total')
+                ),
+                Value(0)
+            ),
+            # Same streak as get_current_streak(), counted only while still active;
+            # not aliased `streak`, which is User's reverse one-to-one accessor
+            partner_streak=Coalesce(
+                Subquery(
+                    Streak.objects.filter(
+                        user_id=OuterRef('pk'),
+                        last_activity_date__gte=streak_since
+                    ).values('current_streak')[:1]
+                ),
+                Value(0)
+            )
+        ).get()
+        current_activity_title = stats['partner_current_activity']
+        activities_today = stats['partner_activities_today']
+        partner_streak = stats['partner_streak']
         
         data = {
             'has_partner': True,
@@ -1157,7 +1423,7 @@ class PartnerViewSet(viewsets.GenericViewSet):
         Check partner's activity status for a specific activity
         GET /api/partner/activity-status/?activity_id=uuid
         """
-        if not request.user.partner:
+        if not request.user.partner_id:
             return Response({
                 'success': False,
                 'message': 'No partner linked'
@@ -1170,38 +1436,43 @@ class PartnerViewSet(viewsets.GenericViewSet):
                 'message': 'activity_id is required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        try:
-            activity = Activity.objects.get(id=activity_id)
-        except Activity.DoesNotExist:
+        partner_id = request.user.partner_id
+        today_start, today_end = day_range(timezone.localdate())
+        
+        # Title plus the partner's completion/session state in one row, instead
+        # of a full Activity row, a full completion row and an EXISTS
+        activity = Activity.objects.filter(id=activity_id).values(
+            'title_en',
+            completed_at=Subquery(
+                ActivityCompletion.objects.filter(
+                    user_id=partner_id,
+                    activity=OuterRef('pk'),
+                    completed_at__gte=today_start,
+                    completed_at__lt=today_end
+                ).values('completed_at')[:1]
+            ),
+            in_progress=Exists(
+                ActivitySession.objects.filter(
+                    user_id=partner_id,
+                    activity=OuterRef('pk'),
+                    status__in=['started', 'in_progress']
+                )
+            )
+        ).first()
+        
+        if activity is None:
             return Response({
                 'success': False,
                 'message': 'Activity not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        partner = request.user.partner
-        today = timezone.now().date()
-        
-        # Check completion
-        completion = ActivityCompletion.objects.filter(
-            user=partner,
-            activity=activity,
-            completed_at__date=today
-        ).first()
-        
-        # Check in progress
-        in_progress = ActivitySession.objects.filter(
-            user=partner,
-            activity=activity,
-            status__in=['started', 'in_progress']
-        ).exists()
-        
         return Response({
             'success': True,
             'activity_id': activity_id,
-            'activity_title': activity.title_en,
-            'partner_completed': completion is not None,
-            'partner_in_progress': in_progress,
-            'completed_at': completion.completed_at if completion else None
+            'activity_title': activity['title_en'],
+            'partner_completed': activity['completed_at'] is not None,
+            'partner_in_progress': activity['in_progress'],
+            'completed_at': activity['completed_at']
         })
     
     @action(detail=False, methods=['get'])
@@ -1210,10 +1481,10 @@ class PartnerViewSet(viewsets.GenericViewSet):
         Get partner-related notifications
         GET /api/partner/notifications/
         """
-        notifications = Notification.objects.filter(
-            user=request.user,
-            notification_type='partner_activity'
-        )[:20]
+        notifications = list(defer_unused_columns(
+            Notification.objects.filter(user=request.user, notification_type='partner_activity'),
+            NotificationSerializer, request.user
+        )[:20])
         
         serializer = NotificationSerializer(
             notifications,
@@ -1223,7 +1494,7 @@ class PartnerViewSet(viewsets.GenericViewSet):
         
         return Response({
             'success': True,
-            'count': len(serializer.data),
+            'count': len(notifications),
             'notifications': serializer.data
         })
 
@@ -1232,6 +1503,9 @@ class PartnerViewSet(viewsets.GenericViewSet):
 # NOTIFICATION VIEWSET
 # ============================================
 
+NOTIFICATION_MAX_LIMIT = 100
+
+
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for notifications
@@ -1241,7 +1515,10 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        queryset = Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        if self.action in ('list', 'retrieve'):
+            queryset = defer_unused_columns(queryset, NotificationSerializer, self.request.user)
+        return queryset
     
     def list(self, request, *args, **kwargs):
         """
@@ -1255,15 +1532,18 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         if request.query_params.get('unread_only', '').lower() == 'true':
             queryset = queryset.filter(is_read=False)
         
-        # Limit
-        limit = int(request.query_params.get('limit', 20))
-        queryset = queryset[:limit]
+        # Limit (bounded, like the activity pages)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), NOTIFICATION_MAX_LIMIT)
+        except ValueError:
+            limit = 20
+        notifications = list(queryset[:limit])
         
-        serializer = self.get_serializer(queryset, many=True)
+        serializer = self.get_serializer(notifications, many=True)
         
         return Response({
             'success': True,
-            'count': len(serializer.data),
+            'count': len(notifications),
             'notifications': serializer.data
         })
     
@@ -1278,7 +1558,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         if not notification.is_read:
             notification.is_read = True
             notification.read_at = timezone.now()
-            notification.save()
+            notification.save(update_fields=['is_read', 'read_at'])
         
         return Response({
             'success': True,
@@ -1296,7 +1576,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
             is_read=False
         ).update(
             is_read=True,
-            read_at=timezone.now()
+            read_at=Now()
         )
         
         return Response({
@@ -1316,7 +1596,8 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
             is_read=False
         ).count()
         
-        return Response({
+        # Polled by the app badge: render directly and answer 304 while unchanged
+        return conditional_json_response(request, {
             'success': True,
             'unread_count': count
         })
@@ -1373,10 +1654,12 @@ class SettingsViewSet(viewsets.GenericViewSet):
         
         # Update user profile settings
         profile_data = request.data.get('profile', {})
-        for key in ['preferred_language', 'theme']:
-            if key in profile_data:
-                setattr(user, key, profile_data[key])
-        user.save()
+        changed = [key for key in ['preferred_language', 'theme'] if key in profile_data]
+        for key in changed:
+            setattr(user, key, profile_data[key])
+        if changed:
+            # Only these columns: a full save would write back a stale coin balance
+            user.save(update_fields=changed + ['updated_at'])
         
         # Update notification preferences
         notification_data = request.data.get('notifications', {})
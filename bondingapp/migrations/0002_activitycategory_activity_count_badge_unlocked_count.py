@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activitycategory",
+            name="activity_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="badge",
+            name="unlocked_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+    ]
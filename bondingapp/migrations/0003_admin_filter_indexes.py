@@ -0,0 +1,53 @@
+# Generated by Django 5.0 on 2026-10-15 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0002_activitycategory_activity_count_badge_unlocked_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["created_at"], name="users_created_6541e9_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="activitycompletion",
+            index=models.Index(
+                fields=["completed_at"], name="activity_co_complet_76f4ff_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="streak",
+            index=models.Index(
+                fields=["last_activity_date"], name="streaks_last_ac_61c647_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userbadge",
+            index=models.Index(
+                fields=["unlocked_at"], name="user_badges_unlocke_6799f6_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["is_read", "is_sent"], name="notificatio_is_read_f29e89_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cointransaction",
+            index=models.Index(
+                fields=["created_at"], name="coin_transa_created_fe3301_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cointransaction",
+            index=models.Index(
+                fields=["transaction_type"], name="coin_transa_transac_e75264_idx"
+            ),
+        ),
+    ]
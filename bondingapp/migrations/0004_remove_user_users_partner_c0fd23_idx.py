@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-15 12:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0003_admin_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="user",
+            name="users_partner_c0fd23_idx",
+        ),
+    ]
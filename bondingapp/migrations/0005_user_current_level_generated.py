@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-15 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0004_remove_user_users_partner_c0fd23_idx"),
+    ]
+
+    operations = [
+        # A plain column cannot be altered into a generated one
+        migrations.RemoveField(
+            model_name="user",
+            name="current_level",
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="current_level",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(total_points__gte=3001, then=models.Value(4)),
+                    models.When(total_points__gte=1501, then=models.Value(3)),
+                    models.When(total_points__gte=501, then=models.Value(2)),
+                    default=models.Value(1),
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+    ]
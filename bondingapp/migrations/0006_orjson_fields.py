@@ -0,0 +1,74 @@
+# Generated by Django 5.0 on 2026-10-15 13:40
+
+import bondingapp.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0005_user_current_level_generated"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activity",
+            name="instructions_en",
+            field=bondingapp.models.ORJSONField(),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="instructions_hi",
+            field=bondingapp.models.ORJSONField(),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="materials_needed_en",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="materials_needed_hi",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="tips_en",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="tips_hi",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="questions_en",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="questions_hi",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activitycompletion",
+            name="photos",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="activitycompletion",
+            name="responses",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="badge",
+            name="criteria",
+            field=bondingapp.models.ORJSONField(),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="data",
+            field=bondingapp.models.ORJSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-15 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0006_orjson_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category", "difficulty", "mode", "is_premium"],
+                name="activity_list_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_daily_featured", True)),
+                fields=["category"],
+                name="activity_daily_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-15 14:30
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def clear_conflicting_partners(apps, schema_editor):
+    """Keep one link per partner: the mutual one, else the oldest user's"""
+    User = apps.get_model("bondingapp", "User")
+    shared = (
+        User.objects.filter(partner__isnull=False).values("partner_id")
+        .annotate(links=Count("pk")).filter(links__gt=1).values_list("partner_id", flat=True)
+    )
+    for partner_id in list(shared):
+        claimants = list(
+            User.objects.filter(partner_id=partner_id).order_by("created_at").values_list("pk", flat=True)
+        )
+        linked_back = User.objects.filter(pk=partner_id).values_list("partner_id", flat=True).first()
+        keep = linked_back if linked_back in claimants else claimants[0]
+        User.objects.filter(partner_id=partner_id).exclude(pk=keep).update(partner=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0007_activity_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_conflicting_partners, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(fields=("partner",), name="unique_partner"),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0 on 2026-10-15 14:50
+
+from django.db import migrations, models
+
+
+def abandon_duplicate_sessions(apps, schema_editor):
+    """Keep each user's newest open session per activity; abandon the older ones"""
+    ActivitySession = apps.get_model("bondingapp", "ActivitySession")
+    seen = set()
+    stale = []
+    for pk, user_id, activity_id in ActivitySession.objects.filter(
+        status__in=["started", "in_progress"]
+    ).order_by("user_id", "activity_id", "-started_at").values_list(
+        "pk", "user_id", "activity_id"
+    ).iterator():
+        if (user_id, activity_id) in seen:
+            stale.append(pk)
+        else:
+            seen.add((user_id, activity_id))
+    ActivitySession.objects.filter(pk__in=stale).update(status="abandoned")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0008_user_unique_partner"),
+    ]
+
+    operations = [
+        migrations.RunPython(abandon_duplicate_sessions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="activitysession",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status__in", ["started", "in_progress"])),
+                fields=("user", "activity"),
+                name="activity_session_active_uniq",
+            ),
+        ),
+    ]
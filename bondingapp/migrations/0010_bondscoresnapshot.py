@@ -0,0 +1,44 @@
+# Generated by Django 5.0 on 2026-10-15 16:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0009_activitysession_active_uniq"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BondScoreSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("score", models.IntegerField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bond_score_snapshots",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "bond_score_snapshots",
+                "ordering": ["date"],
+                "unique_together": {("user", "date")},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-15 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0010_bondscoresnapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-created_at"], name="notification_user_recent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.0 on 2026-10-15 17:30
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_claim_dates(apps, schema_editor):
+    """Date existing bonuses by local day; repeat claims of a day stay undated"""
+    CoinTransaction = apps.get_model("bondingapp", "CoinTransaction")
+    seen = set()
+    claimed = []
+    for bonus in CoinTransaction.objects.filter(
+        transaction_type="earned_daily_bonus"
+    ).order_by("user_id", "created_at").only("pk", "user_id", "created_at").iterator():
+        key = (bonus.user_id, timezone.localtime(bonus.created_at).date())
+        if key in seen:
+            continue
+        seen.add(key)
+        bonus.claim_date = key[1]
+        claimed.append(bonus)
+    CoinTransaction.objects.bulk_update(claimed, ["claim_date"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0011_notification_user_recent_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cointransaction",
+            name="claim_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_claim_dates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="cointransaction",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("transaction_type", "earned_daily_bonus")),
+                fields=("user", "claim_date"),
+                name="unique_daily_bonus",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-15 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0012_cointransaction_unique_daily_bonus"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitycompletion",
+            index=models.Index(
+                fields=["user", "activity"], name="completion_user_activity_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-15 18:25
+
+from django.db import migrations, models
+
+
+def drop_duplicate_streaks(apps, schema_editor):
+    """Keep each user's best streak row (highest current_streak, newest on ties)"""
+    Streak = apps.get_model("bondingapp", "Streak")
+    seen = set()
+    duplicates = []
+    for pk, user_id in Streak.objects.order_by(
+        "user_id", "-current_streak", "-updated_at"
+    ).values_list("pk", "user_id").iterator():
+        if user_id in seen:
+            duplicates.append(pk)
+        else:
+            seen.add(user_id)
+    Streak.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0013_completion_user_activity_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_streaks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="streak",
+            constraint=models.UniqueConstraint(fields=("user",), name="unique_streak_user"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-15 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0014_streak_unique_user"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="activitycompletion",
+            name="activity_co_user_id_f7fe76_idx",
+        ),
+        migrations.AddIndex(
+            model_name="activitycompletion",
+            index=models.Index(
+                fields=["user", "completed_at"], include=["id"], name="ac_user_dt_cov"
+            ),
+        ),
+    ]
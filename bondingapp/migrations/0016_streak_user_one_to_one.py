@@ -0,0 +1,28 @@
+# Generated by Django 5.0 on 2026-10-15 19:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0015_activitycompletion_covering_index"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="streak",
+            name="unique_streak_user",
+        ),
+        migrations.AlterField(
+            model_name="streak",
+            name="user",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="streak",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2026-10-15 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0016_streak_user_one_to_one"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_user_id_a4dd5c_idx",
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user"],
+                name="notif_unread_part",
+            ),
+        ),
+    ]
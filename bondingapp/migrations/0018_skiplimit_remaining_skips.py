@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-15 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0017_notification_unread_partial_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="skiplimit",
+            name="remaining_skips",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.F("max_skips_per_day") - models.F("skips_used"),
+                output_field=models.IntegerField(),
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.0 on 2026-10-15 20:40
+
+from django.db import migrations
+
+
+# (model, table, column, B-tree being replaced, BRIN replacing it)
+SWAPS = [
+    (
+        "activitycompletion", "activity_completions", "completed_at",
+        "activity_co_complet_76f4ff_idx", "completion_done_brin",
+    ),
+    (
+        "cointransaction", "coin_transactions", "created_at",
+        "coin_transa_created_fe3301_idx", "coin_tx_created_brin",
+    ),
+]
+
+
+def to_brin(apps, schema_editor):
+    # BRIN is PostgreSQL-only and kept out of model state, so table remakes on
+    # other backends never try to recreate it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, table, column, btree, brin in SWAPS:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{brin}" ON "{table}" '
+            f'USING brin ("{column}") WITH (pages_per_range = 32)'
+        )
+
+
+def drop_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, table, column, btree, brin in SWAPS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{brin}"')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bondingapp", "0018_skiplimit_remaining_skips"),
+    ]
+
+    operations = [
+        migrations.RunPython(to_brin, drop_brin),
+        # The B-trees are dropped on every backend (and tracked in state)
+        *[
+            migrations.RemoveIndex(model_name=model_name, name=btree)
+            for model_name, table, column, btree, brin in SWAPS
+        ],
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-15 21:15
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def count_recent_completions(apps, schema_editor):
+    User = apps.get_model("bondingapp", "User")
+    ActivityCompletion = apps.get_model("bondingapp", "ActivityCompletion")
+    counts = ActivityCompletion.objects.filter(
+        user=OuterRef("pk"), completed_at__gte=timezone.now() - timedelta(days=30)
+    ).order_by().values("user").annotate(total=Count("pk")).values("total")
+    User.objects.update(completions_count_30d=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0019_completion_coin_brin_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="completions_count_30d",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_recent_completions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-15 21:50
+
+import bondingapp.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0020_user_completions_count_30d"),
+    ]
+
+    # Only the Python-side default changes; the uuid columns are untouched, so
+    # this is state-only (SQLite would otherwise rebuild all four tables)
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name=model_name,
+                    name="id",
+                    field=models.UUIDField(
+                        default=bondingapp.models.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                )
+                for model_name in (
+                    "activitysession", "activitycompletion", "notification", "cointransaction"
+                )
+            ],
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+# (model, fields, constraint name) formerly declared with unique_together
+CONSTRAINTS = [
+    ("userbadge", ["user", "badge"], "unique_user_badge"),
+    ("usermilestone", ["user", "milestone"], "unique_user_milestone"),
+    ("skiplimit", ["user", "date"], "unique_skip_limit_day"),
+    ("bondscoresnapshot", ["user", "date"], "unique_bond_snapshot_day"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0021_time_ordered_uuid_pks"),
+    ]
+
+    # Each named constraint is created before the old unique index is dropped
+    operations = [
+        operation
+        for model_name, fields, name in CONSTRAINTS
+        for operation in (
+            migrations.AddConstraint(
+                model_name=model_name,
+                constraint=models.UniqueConstraint(fields=fields, name=name),
+            ),
+            migrations.AlterUniqueTogether(
+                name=model_name,
+                unique_together=set(),
+            ),
+        )
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0 on 2026-10-15 22:45
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+
+def count_completions(apps, schema_editor):
+    Activity = apps.get_model("bondingapp", "Activity")
+    ActivityCompletion = apps.get_model("bondingapp", "ActivityCompletion")
+    completions = ActivityCompletion.objects.filter(activity=OuterRef("pk")).order_by().values(
+        "activity"
+    )
+    rated = completions.filter(rating__isnull=False)
+    Activity.objects.update(
+        completion_count=Coalesce(
+            Subquery(completions.annotate(total=Count("pk")).values("total")), Value(0)
+        ),
+        rating_sum=Coalesce(Subquery(rated.annotate(total=Sum("rating")).values("total")), Value(0)),
+        rating_count=Coalesce(
+            Subquery(rated.annotate(total=Count("pk")).values("total")), Value(0)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0022_unique_together_to_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activity",
+            name="rating_sum",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="activity",
+            name="rating_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_completions, migrations.RunPython.noop),
+        # A plain column cannot be altered into a generated one
+        migrations.RemoveField(
+            model_name="activity",
+            name="average_rating",
+        ),
+        migrations.AddField(
+            model_name="activity",
+            name="average_rating",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=Coalesce(
+                    Cast("rating_sum", models.DecimalField(max_digits=12, decimal_places=2))
+                    / NullIf("rating_count", 0),
+                    Value(0),
+                    output_field=models.DecimalField(max_digits=3, decimal_places=2),
+                ),
+                output_field=models.DecimalField(max_digits=3, decimal_places=2),
+            ),
+        ),
+    ]
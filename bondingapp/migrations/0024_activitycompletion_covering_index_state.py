@@ -0,0 +1,28 @@
+# Generated by Django 5.0 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bondingapp", "0023_activity_rating_totals"),
+    ]
+
+    # Drops INCLUDE (id) from ac_user_dt_cov in model state only: PostgreSQL
+    # keeps the covering index 0015 built, and SQLite, which never had the
+    # non-key column, stops reporting models.W040
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="activitycompletion",
+                    name="ac_user_dt_cov",
+                ),
+                migrations.AddIndex(
+                    model_name="activitycompletion",
+                    index=models.Index(fields=["user", "completed_at"], name="ac_user_dt_cov"),
+                ),
+            ],
+        ),
+    ]
@@ -1,10 +1,82 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf
 from django.utils import timezone
 from datetime import timedelta
+import secrets
+import string
+import time
 import uuid
 
+import orjson
+
+
+# (min points, max points) per level, 1-indexed; the top level has no ceiling
+LEVEL_THRESHOLDS = ((0, 500), (501, 1500), (1501, 3000), (3001, None))
+
+
+def level_expression():
+    """SQL CASE mapping total_points to the level in LEVEL_THRESHOLDS"""
+    return models.Case(
+        *[
+            models.When(total_points__gte=low, then=models.Value(level))
+            for level, (low, _) in reversed(list(enumerate(LEVEL_THRESHOLDS, start=1)))
+            if level > 1
+        ],
+        default=models.Value(1),
+        output_field=models.IntegerField()
+    )
+
+
+def average_rating_expression():
+    """SQL mean of Activity.rating_sum over rating_count, 0 before the first rating"""
+    return Coalesce(
+        Cast('rating_sum', models.DecimalField(max_digits=12, decimal_places=2))
+        / NullIf('rating_count', 0),
+        models.Value(0),
+        output_field=models.DecimalField(max_digits=3, decimal_places=2)
+    )
+
+
+class ORJSONField(models.JSONField):
+    """JSONField whose stored documents are decoded with orjson when read"""
+    
+    def from_db_value(self, value, expression, connection):
+        # None, custom decoders and already-decoded key lookups keep Django's handling
+        if self.decoder is not None or not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit millisecond timestamp,
+    then random bits. New rows land at the right edge of the primary key index
+    instead of a random page.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    # Version 7 in bits 76-79, RFC 4122 variant (0b10) in bits 62-63
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+INVITATION_CODE_ALPHABET = string.ascii_uppercase + string.digits
+INVITATION_CODE_ATTEMPTS = 5
+
+
+def new_invitation_code():
+    """
+    Random 8-character invitation code. Uniqueness is left to the column's
+    unique index: with 36**8 codes a collision is vanishingly rare, so no
+    lookup is spent on it up front.
+    """
+    return ''.join(secrets.choice(INVITATION_CODE_ALPHABET) for _ in range(8))
+
 
 class User(AbstractUser):
     """Extended User model with relationship features"""
@@ -41,8 +113,16 @@ class User(AbstractUser):
     
     # Activity tracking
     total_points = models.IntegerField(default=0)
-    current_level = models.IntegerField(default=1)
+    # Derived from total_points by the database, never written from Python
+    current_level = models.GeneratedField(
+        expression=level_expression(),
+        output_field=models.IntegerField(),
+        db_persist=True
+    )
     coins = models.IntegerField(default=0)
+    # Completions in the last 30 days, for the bond score: bumped with each
+    # completion, recounted nightly as old ones age out
+    completions_count_30d = models.IntegerField(default=0, editable=False)
     
     # Timestamps
     last_active = models.DateTimeField(auto_now=True)
@@ -58,35 +138,51 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=['email']),
             models.Index(fields=['google_id']),
-            models.Index(fields=['partner_invitation_code']),
+            models.Index(fields=['created_at']),
+        ]
+        constraints = [
+            # Partnerships are 1:1; NULLs (no partner) are not compared
+            models.UniqueConstraint(fields=['partner'], name='unique_partner'),
         ]
     
     def __str__(self):
         return f"{self.username} ({self.email})"
     
-    def generate_invitation_code(self):
-        """Generate unique 8-character invitation code"""
-        import random
-        import string
-        while True:
-            code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-            if not User.objects.filter(partner_invitation_code=code).exists():
-                self.partner_invitation_code = code
-                self.save()
+    def generate_invitation_code(self, save=True):
+        """Generate unique 8-character invitation code (save=False leaves saving to the caller)"""
+        if not save:
+            self.partner_invitation_code = code = new_invitation_code()
+            return code
+        for _ in range(INVITATION_CODE_ATTEMPTS):
+            self.partner_invitation_code = code = new_invitation_code()
+            try:
+                # Savepoint, so a collision does not poison an outer transaction
+                with transaction.atomic():
+                    self.save(update_fields=['partner_invitation_code'])
                 return code
-    
-    def calculate_bond_score(self):
-        """Calculate bond score based on activities completed"""
-        if not self.partner:
+            except IntegrityError:
+                continue
+        raise IntegrityError('Could not allocate an unused invitation code')
+    
+    def calculate_bond_score(self, user_completions=None, partner_completions=None, streak=None):
+        """
+        Calculate bond score based on activities completed
+        Counts/streak already annotated by the caller are used instead of querying.
+        """
+        if not self.partner_id:
             return 0
         
-        # Get activities completed by both partners in last 30 days
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        user_completions = self.activity_completions.filter(completed_at__gte=thirty_days_ago).count()
-        partner_completions = self.partner.activity_completions.filter(completed_at__gte=thirty_days_ago).count()
+        # Activities completed by both partners in last 30 days (stored counters)
+        if user_completions is None:
+            user_completions = self.completions_count_30d
+        if partner_completions is None:
+            partner_completions = User.objects.filter(pk=self.partner_id).values_list(
+                'completions_count_30d', flat=True
+            ).first() or 0
         
         # Get streak
-        streak = self.get_current_streak()
+        if streak is None:
+            streak = self.get_current_streak()
         
         # Calculate score (out of 100)
         base_score = min((user_completions + partner_completions) * 2, 60)  # Max 60 from activities
@@ -97,10 +193,12 @@ class User(AbstractUser):
     
     def get_current_streak(self):
         """Calculate current activity streak"""
-        streak_obj = self.streaks.first()
-        if streak_obj and streak_obj.is_active():
-            return streak_obj.current_streak
-        return 0
+        # Free when the caller used select_related('streak')
+        try:
+            streak_obj = self.streak
+        except Streak.DoesNotExist:
+            return 0
+        return streak_obj.current_streak if streak_obj.is_active() else 0
 
 
 class UserPreference(models.Model):
@@ -154,6 +252,9 @@ class ActivityCategory(models.Model):
     display_order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     
+    # Denormalized count of active activities (refreshed periodically)
+    activity_count = models.IntegerField(default=0, editable=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -166,9 +267,22 @@ class ActivityCategory(models.Model):
         return f"{self.icon} {self.name_en}"
 
 
+class ActivityQuerySet(models.QuerySet):
+    
+    def for_list(self):
+        """Skip the detail-only JSON columns list views never render"""
+        return self.defer(*Activity.DETAIL_ONLY_FIELDS)
+
+
 class Activity(models.Model):
     """Activity templates that users can complete"""
     
+    # Step/material/tip/question arrays, rendered only by the detail view
+    DETAIL_ONLY_FIELDS = (
+        'instructions_en', 'instructions_hi', 'materials_needed_en', 'materials_needed_hi',
+        'tips_en', 'tips_hi', 'questions_en', 'questions_hi'
+    )
+    
     DIFFICULTY_CHOICES = [
         ('easy', 'Easy'),
         ('medium', 'Medium'),
@@ -196,8 +310,8 @@ class Activity(models.Model):
     title_hi = models.CharField(max_length=200)
     description_en = models.TextField()
     description_hi = models.TextField()
-    instructions_en = models.JSONField()  # Array of steps
-    instructions_hi = models.JSONField()
+    instructions_en = ORJSONField()  # Array of steps
+    instructions_hi = ORJSONField()
     
     # Metadata
     difficulty = models.CharField(max_length=10, choices=DIFFICULTY_CHOICES, default='medium')
@@ -206,14 +320,14 @@ class Activity(models.Model):
     mode = models.CharField(max_length=10, choices=MODE_CHOICES, default='both')
     
     # Materials & Tips
-    materials_needed_en = models.JSONField(null=True, blank=True)  # Array of items
-    materials_needed_hi = models.JSONField(null=True, blank=True)
-    tips_en = models.JSONField(null=True, blank=True)  # Array of tips
-    tips_hi = models.JSONField(null=True, blank=True)
+    materials_needed_en = ORJSONField(null=True, blank=True)  # Array of items
+    materials_needed_hi = ORJSONField(null=True, blank=True)
+    tips_en = ORJSONField(null=True, blank=True)  # Array of tips
+    tips_hi = ORJSONField(null=True, blank=True)
     
     # Questions/Prompts (if applicable)
-    questions_en = models.JSONField(null=True, blank=True)  # Array of questions
-    questions_hi = models.JSONField(null=True, blank=True)
+    questions_en = ORJSONField(null=True, blank=True)  # Array of questions
+    questions_hi = ORJSONField(null=True, blank=True)
     
     # Gamification
     points_reward = models.IntegerField(default=10)
@@ -227,19 +341,40 @@ class Activity(models.Model):
     is_active = models.BooleanField(default=True)
     is_daily_featured = models.BooleanField(default=False)
     
-    # Analytics
+    # Analytics: running totals bumped with F() as completions come in
     completion_count = models.IntegerField(default=0)
-    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00)
+    rating_sum = models.IntegerField(default=0, editable=False)
+    rating_count = models.IntegerField(default=0, editable=False)
+    # Derived from the rating totals by the database, never written from Python
+    average_rating = models.GeneratedField(
+        expression=average_rating_expression(),
+        output_field=models.DecimalField(max_digits=3, decimal_places=2),
+        db_persist=True
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ActivityQuerySet.as_manager()
+    
     class Meta:
         db_table = 'activities'
         indexes = [
             models.Index(fields=['category', 'difficulty']),
             models.Index(fields=['is_daily_featured']),
             models.Index(fields=['is_premium']),
+            # ActivityViewSet list filters, over the active catalog only
+            models.Index(
+                fields=['category', 'difficulty', 'mode', 'is_premium'],
+                condition=models.Q(is_active=True),
+                name='activity_list_idx'
+            ),
+            # Daily featured listing
+            models.Index(
+                fields=['category'],
+                condition=models.Q(is_active=True, is_daily_featured=True),
+                name='activity_daily_idx'
+            ),
         ]
     
     def __str__(self):
@@ -257,7 +392,7 @@ class ActivitySession(models.Model):
         ('abandoned', 'Abandoned'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_sessions')
     activity = models.ForeignKey(Activity, on_delete=models.CASCADE, related_name='sessions')
     
@@ -277,6 +412,14 @@ class ActivitySession(models.Model):
             models.Index(fields=['user', 'status']),
             models.Index(fields=['started_at']),
         ]
+        constraints = [
+            # At most one open session per user and activity
+            models.UniqueConstraint(
+                fields=['user', 'activity'],
+                condition=models.Q(status__in=['started', 'in_progress']),
+                name='activity_session_active_uniq'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.activity.title_en} ({self.status})"
@@ -285,14 +428,14 @@ class ActivitySession(models.Model):
 class ActivityCompletion(models.Model):
     """Records completed activities with user responses"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_completions')
     activity = models.ForeignKey(Activity, on_delete=models.CASCADE, related_name='completions')
     session = models.OneToOneField(ActivitySession, on_delete=models.CASCADE, related_name='completion')
     
     # Responses
-    responses = models.JSONField(null=True, blank=True)  # Store Q&A or completion data
-    photos = models.JSONField(null=True, blank=True)  # Array of photo URLs
+    responses = ORJSONField(null=True, blank=True)  # Store Q&A or completion data
+    photos = ORJSONField(null=True, blank=True)  # Array of photo URLs
     notes = models.TextField(null=True, blank=True)
     
     # Ratings & Feedback
@@ -315,8 +458,16 @@ class ActivityCompletion(models.Model):
     class Meta:
         db_table = 'activity_completions'
         indexes = [
-            models.Index(fields=['user', 'completed_at']),
+            # Also serves newest-first scans: B-tree indexes read backwards.
+            # On PostgreSQL it also carries id (INCLUDE, migration 0015) so
+            # COUNT('id') over a user's date range is an index-only scan; the
+            # INCLUDE is kept out of model state (SQLite has no covering indexes)
+            models.Index(fields=['user', 'completed_at'], name='ac_user_dt_cov'),
+            # "Has this user done this activity" EXISTS probes (flags, sync rate)
+            models.Index(fields=['user', 'activity'], name='completion_user_activity_idx'),
             models.Index(fields=['activity']),
+            # completed_at range filters use a BRIN index on PostgreSQL, created by
+            # migration 0019 outside model state (SQLite has no BRIN)
         ]
         ordering = ['-completed_at']
     
@@ -327,7 +478,7 @@ class ActivityCompletion(models.Model):
 class Streak(models.Model):
     """Tracks user's daily activity streak"""
     
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='streaks')
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='streak')
     
     current_streak = models.IntegerField(default=0)
     longest_streak = models.IntegerField(default=0)
@@ -342,6 +493,9 @@ class Streak(models.Model):
     class Meta:
         db_table = 'streaks'
         ordering = ['-current_streak']
+        indexes = [
+            models.Index(fields=['last_activity_date']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.current_streak} days streak"
@@ -354,33 +508,31 @@ class Streak(models.Model):
         return days_since <= 1
     
     def update_streak(self):
-        """Update streak when user completes an activity"""
+        """
+        Update streak when user completes an activity, as one conditional UPDATE
+        evaluated against the locked row (concurrent completions cannot double
+        count). The instance's fields are not refreshed.
+        """
         today = timezone.now().date()
-        
-        if not self.last_activity_date:
-            # First activity
-            self.current_streak = 1
-            self.longest_streak = 1
-            self.last_activity_date = today
-            self.streak_start_date = today
-            self.total_active_days = 1
-        elif self.last_activity_date == today:
-            # Already completed activity today
-            return
-        elif (today - self.last_activity_date).days == 1:
+        continues = models.Q(last_activity_date=today - timedelta(days=1))
+        next_streak = models.Case(
             # Consecutive day
-            self.current_streak += 1
-            self.longest_streak = max(self.longest_streak, self.current_streak)
-            self.last_activity_date = today
-            self.total_active_days += 1
-        else:
-            # Streak broken
-            self.current_streak = 1
-            self.last_activity_date = today
-            self.streak_start_date = today
-            self.total_active_days += 1
+            models.When(continues, then=models.F('current_streak') + 1),
+            # First activity, or streak broken
+            default=models.Value(1)
+        )
         
-        self.save()
+        # Already completed activity today: the row is left alone
+        Streak.objects.filter(pk=self.pk).exclude(last_activity_date=today).update(
+            current_streak=next_streak,
+            longest_streak=Greatest('longest_streak', next_streak),
+            streak_start_date=models.Case(
+                models.When(continues, then=models.F('streak_start_date')),
+                default=models.Value(today)
+            ),
+            total_active_days=models.F('total_active_days') + 1,
+            last_activity_date=today
+        )
 
 
 class Badge(models.Model):
@@ -406,7 +558,7 @@ class Badge(models.Model):
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     
     # Unlock criteria
-    criteria = models.JSONField()  # e.g., {"type": "streak", "value": 7}
+    criteria = ORJSONField()  # e.g., {"type": "streak", "value": 7}
     points_reward = models.IntegerField(default=50)
     coins_reward = models.IntegerField(default=20)
     
@@ -418,6 +570,9 @@ class Badge(models.Model):
     )
     display_order = models.IntegerField(default=0)
     
+    # Denormalized count of users who unlocked this badge (refreshed periodically)
+    unlocked_count = models.IntegerField(default=0, editable=False)
+    
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
@@ -441,8 +596,13 @@ class UserBadge(models.Model):
     
     class Meta:
         db_table = 'user_badges'
-        unique_together = ['user', 'badge']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'badge'], name='unique_user_badge'),
+        ]
         ordering = ['-unlocked_at']
+        indexes = [
+            models.Index(fields=['unlocked_at']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.badge.name_en}"
@@ -496,7 +656,9 @@ class UserMilestone(models.Model):
     
     class Meta:
         db_table = 'user_milestones'
-        unique_together = ['user', 'milestone']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'milestone'], name='unique_user_milestone'),
+        ]
         ordering = ['-achieved_at']
     
     def __str__(self):
@@ -516,7 +678,7 @@ class Notification(models.Model):
         ('partner_joined', 'Partner Joined'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
     
     notification_type = models.CharField(max_length=30, choices=NOTIFICATION_TYPE_CHOICES)
@@ -528,7 +690,7 @@ class Notification(models.Model):
     message_hi = models.TextField()
     
     # Metadata
-    data = models.JSONField(null=True, blank=True)  # Additional data (activity_id, badge_id, etc.)
+    data = ORJSONField(null=True, blank=True)  # Additional data (activity_id, badge_id, etc.)
     
     # Status
     is_read = models.BooleanField(default=False)
@@ -541,8 +703,13 @@ class Notification(models.Model):
         db_table = 'notifications'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', 'is_read']),
+            # Newest-first pages for one user stop after LIMIT rows
+            models.Index(fields=['user', '-created_at'], name='notification_user_recent_idx'),
+            # Unread count / mark-all-read: only unread rows are indexed, so the
+            # index stays small however many notifications a user has read
+            models.Index(fields=['user'], name='notif_unread_part', condition=models.Q(is_read=False)),
             models.Index(fields=['created_at']),
+            models.Index(fields=['is_read', 'is_sent']),
         ]
     
     def __str__(self):
@@ -556,17 +723,25 @@ class SkipLimit(models.Model):
     date = models.DateField(default=timezone.now)
     skips_used = models.IntegerField(default=0)
     max_skips_per_day = models.IntegerField(default=2)
+    # Derived by the database, so "who can still skip" is a plain filter
+    remaining_skips = models.GeneratedField(
+        expression=models.F('max_skips_per_day') - models.F('skips_used'),
+        output_field=models.IntegerField(),
+        db_persist=True
+    )
     
     class Meta:
         db_table = 'skip_limits'
-        unique_together = ['user', 'date']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_skip_limit_day'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.date} - {self.skips_used}/{self.max_skips_per_day}"
     
     def can_skip(self):
         """Check if user can skip more activities today"""
-        return self.skips_used < self.max_skips_per_day
+        return self.remaining_skips > 0
 
 
 class CoinTransaction(models.Model):
@@ -584,7 +759,7 @@ class CoinTransaction(models.Model):
         ('spent_custom', 'Spent on Custom Activity'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='coin_transactions')
     
     transaction_type = models.CharField(max_length=30, choices=TRANSACTION_TYPE_CHOICES)
@@ -598,12 +773,43 @@ class CoinTransaction(models.Model):
     description = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    # Local date of a daily bonus claim; null for every other transaction type
+    claim_date = models.DateField(null=True, blank=True, editable=False)
+    
     class Meta:
         db_table = 'coin_transactions'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'created_at']),
+            # created_at: BRIN on PostgreSQL only, see ActivityCompletion
+            models.Index(fields=['transaction_type']),
+        ]
+        constraints = [
+            # One daily bonus per user and day, enforced by the INSERT itself
+            models.UniqueConstraint(
+                fields=['user', 'claim_date'],
+                condition=models.Q(transaction_type='earned_daily_bonus'),
+                name='unique_daily_bonus'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.transaction_type} ({self.amount} coins)"
+
+class BondScoreSnapshot(models.Model):
+    """A partnered user's bond score as of the end of a day"""
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bond_score_snapshots')
+    date = models.DateField()
+    score = models.IntegerField()
+    
+    class Meta:
+        db_table = 'bond_score_snapshots'
+        constraints = [
+            # Also the (user, date) index the history range scan reads
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_bond_snapshot_day'),
         ]
+        ordering = ['date']
     
     def __str__(self):
-        return f"{self.user.username} - {self.transaction_type} ({self.amount} coins)"
\ No newline at end of file
+        return f"{self.user.username} - {self.date} - {self.score}"
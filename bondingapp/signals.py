@@ -0,0 +1,72 @@
+"""
+Model signal handlers for Bonding App
+Location: bondingapp/signals.py
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from bondingapp.core.serializers import (
+    invalidate_achievement_catalogs, invalidate_activity_listings, invalidate_category_cache,
+    invalidate_overview_cache, invalidate_streak_cache
+)
+from bondingapp.models import (
+    Activity, ActivityCategory, ActivityCompletion, Badge, Milestone, Streak, UserBadge,
+    UserMilestone
+)
+
+
+@receiver(post_save, sender=ActivityCategory)
+@receiver(post_delete, sender=ActivityCategory)
+def drop_cached_category(sender, instance, **kwargs):
+    """Serialized categories are cached; drop them when the row changes"""
+    invalidate_category_cache([instance.pk])
+
+
+@receiver(post_save, sender=Activity)
+@receiver(post_delete, sender=Activity)
+def drop_cached_listings(sender, instance, **kwargs):
+    """The daily listing is cached per language; rebuild it after activity edits"""
+    invalidate_activity_listings()
+
+
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+@receiver(post_save, sender=Milestone)
+@receiver(post_delete, sender=Milestone)
+def drop_cached_catalogs(sender, instance, **kwargs):
+    """The active badge/milestone catalogs are cached per language"""
+    invalidate_achievement_catalogs()
+
+
+@receiver(post_save, sender=Streak)
+@receiver(post_delete, sender=Streak)
+def drop_cached_streak(sender, instance, **kwargs):
+    """Streak rows created or edited outside update_streak() drop their cached bodies"""
+    transaction.on_commit(partial(invalidate_streak_cache, instance.user_id))
+    transaction.on_commit(partial(invalidate_overview_cache, instance.user_id))
+
+
+@receiver(post_save, sender=ActivityCompletion)
+@receiver(post_delete, sender=ActivityCompletion)
+def drop_cached_overview_for_pair(sender, instance, **kwargs):
+    """Completions feed both partners' overviews (bond score, sync rate)"""
+    # After commit: the INSERT precedes update_streak() in the same transaction,
+    # and a read in between would re-cache the old streak and overview
+    transaction.on_commit(
+        partial(invalidate_overview_cache, instance.user_id, instance.user.partner_id)
+    )
+    # update_streak() is a bare UPDATE that sends no Streak signal
+    transaction.on_commit(partial(invalidate_streak_cache, instance.user_id))
+
+
+@receiver(post_save, sender=UserBadge)
+@receiver(post_delete, sender=UserBadge)
+@receiver(post_save, sender=UserMilestone)
+@receiver(post_delete, sender=UserMilestone)
+def drop_cached_overview(sender, instance, **kwargs):
+    """Badge and milestone counts are part of the cached overview"""
+    invalidate_overview_cache(instance.user_id)
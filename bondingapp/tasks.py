@@ -0,0 +1,371 @@
+"""
+Celery tasks for Bonding App
+Location: bondingapp/tasks.py
+
+Nightly sweeps touch every user, so each one is a small dispatcher that
+fans the work out as many chunk tasks on the gamification queue.
+"""
+
+from itertools import islice
+from datetime import timedelta
+import logging
+
+from celery import shared_task, group, chord
+from django.db import transaction
+from django.db.models import Case, Count, Max, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from bondingapp.models import (
+    User, Streak, Milestone, UserMilestone, CoinTransaction, Notification,
+    Activity, ActivityCategory, ActivityCompletion, Badge, UserBadge, BondScoreSnapshot
+)
+from bondingapp.core.serializers import invalidate_category_cache
+
+logger = logging.getLogger(__name__)
+
+USER_CHUNK_SIZE = 1000
+NOTIFICATION_RETENTION_DAYS = 30
+DELETE_BATCH_SIZE = 10000
+
+
+def _user_id_chunks(chunk_size=USER_CHUNK_SIZE):
+    """Yield lists of user ids (as strings) without loading all users at once"""
+    user_ids = (
+        str(user_id)
+        for user_id in User.objects.values_list('id', flat=True).iterator(chunk_size=chunk_size)
+    )
+    while True:
+        chunk = list(islice(user_ids, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ============================================
+# STREAKS
+# ============================================
+
+@shared_task(ignore_result=True)
+def fanout_streak_check():
+    """Dispatch one streak check per chunk of users"""
+    group(
+        check_streak_chunk.s(user_ids) for user_ids in _user_id_chunks()
+    ).apply_async(queue='gamification')
+
+
+@shared_task(ignore_result=True)
+def check_streak_chunk(user_ids):
+    """Reset streaks that were not continued yesterday"""
+    yesterday = timezone.now().date() - timedelta(days=1)
+    reset = Streak.objects.filter(
+        user_id__in=user_ids,
+        current_streak__gt=0,
+        last_activity_date__lt=yesterday
+    ).update(current_streak=0)
+    
+    if reset:
+        logger.info(f"Reset {reset} broken streaks")
+
+
+# ============================================
+# MILESTONES
+# ============================================
+
+@shared_task(ignore_result=True)
+def fanout_milestone_check():
+    """Dispatch one milestone check per chunk of users and total the awards"""
+    chord(
+        (award_milestones_chunk.s(user_ids) for user_ids in _user_id_chunks()),
+        aggregate_results.s('milestones awarded')
+    ).apply_async(queue='gamification')
+
+
+@shared_task
+def award_milestones_chunk(user_ids):
+    """Award every milestone the given users have reached but not received"""
+    milestones = list(Milestone.objects.filter(is_active=True))
+    if not milestones:
+        return 0
+    
+    today = timezone.now().date()
+    with transaction.atomic():
+        # Lock the chunk's users first: an overlapping sweep waits here and then
+        # sees this run's milestones and balances instead of paying them twice
+        list(
+            User.objects.select_for_update().filter(id__in=user_ids)
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        users = User.objects.filter(id__in=user_ids).annotate(
+            completion_total=Count('activity_completions', distinct=True),
+            best_streak=Max('streak__longest_streak')
+        )
+        already_achieved = set(
+            UserMilestone.objects.filter(user_id__in=user_ids).values_list('user_id', 'milestone_id')
+        )
+        
+        new_milestones = []
+        transactions = []
+        points_by_user = {}
+        coins_by_user = {}
+        for user in users:
+            progress = {
+                'activity_count': user.completion_total,
+                'streak': user.best_streak or 0,
+                'relationship_duration': (
+                    (today - user.relationship_start_date).days
+                    if user.relationship_start_date else 0
+                ),
+            }
+            
+            points = coins = 0
+            for milestone in milestones:
+                if (user.id, milestone.id) in already_achieved:
+                    continue
+                current_value = progress.get(milestone.milestone_type)
+                if current_value is None or current_value < milestone.criteria_value:
+                    continue
+                
+                new_milestones.append(UserMilestone(user=user, milestone=milestone))
+                points += milestone.points_reward
+                coins += milestone.coins_reward
+                transactions.append(CoinTransaction(
+                    user=user,
+                    transaction_type='earned_milestone',
+                    amount=milestone.coins_reward,
+                    # user.coins was read under the lock, so this is the row's balance
+                    balance_after=user.coins + coins,
+                    related_object_id=milestone.id,
+                    related_object_type='milestone',
+                    description=f"Milestone reward: {milestone.name_en}"
+                ))
+            
+            if points or coins:
+                points_by_user[user.id] = points
+                coins_by_user[user.id] = coins
+        
+        # Three statements per chunk, however many users were rewarded. No
+        # ignore_conflicts: a duplicate now aborts the chunk rather than paying
+        # for a milestone that was not inserted
+        UserMilestone.objects.bulk_create(new_milestones)
+        CoinTransaction.objects.bulk_create(transactions)
+        if points_by_user:
+            User.objects.filter(pk__in=points_by_user).update(
+                total_points=F('total_points') + _per_user(points_by_user),
+                coins=F('coins') + _per_user(coins_by_user)
+            )
+    return len(new_milestones)
+
+
+def _per_user(amounts):
+    """CASE picking each row's amount from a {user_id: amount} dict"""
+    return Case(
+        *[When(pk=user_id, then=Value(amount)) for user_id, amount in amounts.items()],
+        default=Value(0)
+    )
+
+
+@shared_task(ignore_result=True)
+def aggregate_results(results, label):
+    """Join step for chunked sweeps: total the per-chunk counts"""
+    logger.info(f"{sum(results)} {label}")
+
+
+# ============================================
+# BOND SCORES
+# ============================================
+
+@shared_task(ignore_result=True)
+def fanout_bond_score_snapshot():
+    """Dispatch one bond score snapshot per chunk of users"""
+    group(
+        snapshot_bond_scores_chunk.s(user_ids) for user_ids in _user_id_chunks()
+    ).apply_async(queue='gamification')
+
+
+@shared_task(ignore_result=True)
+def snapshot_bond_scores_chunk(user_ids):
+    """Store today's bond score for each partnered user in the chunk"""
+    today = timezone.localdate()
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    recent = ActivityCompletion.objects.filter(completed_at__gte=thirty_days_ago).order_by()
+    
+    def recent_completions(user_ref):
+        counts = recent.filter(user_id=OuterRef(user_ref)).values('user_id').annotate(
+            total=Count('pk')
+        ).values('total')
+        return Coalesce(Subquery(counts), Value(0))
+    
+    # calculate_bond_score() inputs, one row per user; counted exactly here
+    # rather than read from completions_count_30d, which lags until 00:05
+    active_streak = Streak.objects.filter(
+        user_id=OuterRef('pk'), last_activity_date__gte=today - timedelta(days=1)
+    ).values('current_streak')[:1]
+    users = User.objects.filter(id__in=user_ids, partner__isnull=False).annotate(
+        recent_total=recent_completions('pk'),
+        partner_recent_total=recent_completions('partner_id'),
+        streak_now=Coalesce(Subquery(active_streak), Value(0))
+    ).only('id', 'partner_id')
+    
+    snapshots = [
+        BondScoreSnapshot(
+            user_id=user.id,
+            date=today,
+            score=user.calculate_bond_score(
+                user_completions=user.recent_total,
+                partner_completions=user.partner_recent_total,
+                streak=user.streak_now
+            )
+        )
+        for user in users
+    ]
+    BondScoreSnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=['user', 'date'],
+        update_fields=['score']
+    )
+
+
+@shared_task(ignore_result=True)
+def fanout_recent_completion_counts():
+    """Dispatch one 30-day completion recount per chunk of users"""
+    group(
+        refresh_recent_completion_counts_chunk.s(user_ids) for user_ids in _user_id_chunks()
+    ).apply_async(queue='gamification')
+
+
+@shared_task(ignore_result=True)
+def refresh_recent_completion_counts_chunk(user_ids):
+    """Recount User.completions_count_30d, dropping completions that aged out"""
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    User.objects.filter(id__in=user_ids).update(
+        completions_count_30d=_count_subquery(
+            ActivityCompletion.objects.filter(completed_at__gte=thirty_days_ago), 'user'
+        )
+    )
+
+
+# ============================================
+# NOTIFICATIONS
+# ============================================
+
+@shared_task(ignore_result=True)
+def create_notification(user_id, notification_type, title_en, title_hi,
+                        message_en, message_hi, data=None):
+    """Insert an in-app notification off the request path"""
+    Notification.objects.create(
+        user_id=user_id,
+        notification_type=notification_type,
+        title_en=title_en,
+        title_hi=title_hi,
+        message_en=message_en,
+        message_hi=message_hi,
+        data=data
+    )
+
+
+# Notification copy, formatted in the worker from a few request-side values
+NOTIFICATION_TEMPLATES = {
+    'partner_joined': {
+        'notification_type': 'partner_joined',
+        'title_en': '{username} is now your partner!',
+        'title_hi': '{username} अब आपके साथी हैं!',
+        'message_en': '{username} has accepted your invitation.',
+        'message_hi': '{username} ने आपका निमंत्रण स्वीकार किया है।',
+    },
+    'partner_activity_started': {
+        'notification_type': 'partner_activity',
+        'title_en': '{username} started an activity',
+        'title_hi': '{username} ने एक गतिविधि शुरू की',
+        'message_en': 'Join them in "{activity_en}"',
+        'message_hi': 'उनके साथ "{activity_hi}" में शामिल हों',
+    },
+    'partner_activity_completed': {
+        'notification_type': 'partner_activity',
+        'title_en': '{username} completed an activity',
+        'title_hi': '{username} ने एक गतिविधि पूरी की',
+        'message_en': 'They completed "{activity_en}"',
+        'message_hi': 'उन्होंने "{activity_hi}" पूरा किया',
+    },
+}
+
+
+@shared_task(ignore_result=True)
+def notify_from_template(user_id, template, params, data=None):
+    """Render a NOTIFICATION_TEMPLATES entry with `params` and insert it"""
+    spec = NOTIFICATION_TEMPLATES[template]
+    create_notification(
+        user_id,
+        spec['notification_type'],
+        title_en=spec['title_en'].format_map(params),
+        title_hi=spec['title_hi'].format_map(params),
+        message_en=spec['message_en'].format_map(params),
+        message_hi=spec['message_hi'].format_map(params),
+        data=data
+    )
+
+
+# ============================================
+# MAINTENANCE
+# ============================================
+
+@shared_task(ignore_result=True)
+def cleanup_old_notifications():
+    """Delete notifications older than the retention window in small batches"""
+    cutoff = timezone.now() - timedelta(days=NOTIFICATION_RETENTION_DAYS)
+    stale = Notification.objects.filter(created_at__lt=cutoff)
+    
+    total = 0
+    while True:
+        # Keep each DELETE (and its transaction) bounded
+        batch = list(stale.values_list('pk', flat=True)[:DELETE_BATCH_SIZE])
+        if not batch:
+            break
+        deleted, _ = Notification.objects.filter(pk__in=batch).delete()
+        total += deleted
+    
+    logger.info(f"Deleted {total} old notifications")
+
+
+@shared_task(ignore_result=True)
+def flush_expired_tokens():
+    """Drop expired outstanding (and, by cascade, blacklisted) refresh tokens"""
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+    
+    total = 0
+    while True:
+        batch = list(expired.values_list('pk', flat=True)[:DELETE_BATCH_SIZE])
+        if not batch:
+            break
+        deleted, _ = OutstandingToken.objects.filter(pk__in=batch).delete()
+        total += deleted
+    
+    logger.info(f"Deleted {total} expired token rows")
+
+
+def _count_subquery(queryset, field):
+    """Correlated COUNT(*) per OuterRef('pk') for use inside UPDATE ... SET"""
+    counts = queryset.filter(**{field: OuterRef('pk')}).values(field).annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts), Value(0))
+
+
+@shared_task(ignore_result=True)
+def refresh_admin_counters():
+    """Recompute the denormalized category/badge counters, one UPDATE each"""
+    active_count = _count_subquery(Activity.objects.filter(is_active=True), 'category')
+    # Only touch (and uncache) categories whose count moved since the last run
+    changed = list(
+        ActivityCategory.objects.alias(fresh_count=active_count)
+        .exclude(activity_count=F('fresh_count'))
+        .values_list('pk', flat=True)
+    )
+    if changed:
+        ActivityCategory.objects.filter(pk__in=changed).update(activity_count=active_count)
+        invalidate_category_cache(changed)
+    Badge.objects.update(
+        unlocked_count=_count_subquery(UserBadge.objects.all(), 'badge')
+    )
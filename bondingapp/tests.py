@@ -1,3 +1,310 @@
+"""
+API behaviour tests for Bonding App
+Location: bondingapp/tests.py
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+import tablib
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
 from django.test import TestCase
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+from rest_framework.test import APIClient
+
+from bonding.celery import app as celery_app
+from bondingapp.admin import ActivityCategoryResource
+from bondingapp.core.serializers import PASSWORD_MAX_LENGTH
+from bondingapp.models import (
+    User, ActivityCategory, Activity, ActivitySession, ActivityCompletion, Streak,
+    SkipLimit, CoinTransaction, Milestone, UserMilestone
+)
+from bondingapp.tasks import award_milestones_chunk
+
+
+class MigrationTests(TestCase):
+    """The test database is built by running every migration on the configured backend"""
+    
+    def test_all_migrations_applied(self):
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        self.assertEqual(plan, [])
+    
+    def test_models_match_migrations(self):
+        call_command('makemigrations', 'bondingapp', check=True, dry_run=True, verbosity=0)
+
+
+class AdminImportTests(TestCase):
+    
+    def test_bulk_import_updates_and_inserts(self):
+        talk = ActivityCategory.objects.create(
+            name_en='Talk', name_hi='बात', description_en='Talk', description_hi='बात',
+            icon='💬', color='#FFB6C1'
+        )
+        dataset = tablib.Dataset(headers=[
+            'id', 'name_en', 'name_hi', 'description_en', 'description_hi',
+            'icon', 'color', 'display_order', 'is_active'
+        ])
+        dataset.append(['', 'Talk', 'बात', 'Talk more', 'बात', '💬', '#FFB6C1', 1, True])
+        dataset.append(['', 'Play', 'खेल', 'Play', 'खेल', '🎲', '#87CEEB', 2, True])
+        
+        result = ActivityCategoryResource().import_data(dataset, raise_errors=True)
+        self.assertFalse(result.has_errors())
+        talk.refresh_from_db()
+        self.assertEqual(talk.description_en, 'Talk more')
+        self.assertTrue(ActivityCategory.objects.filter(name_en='Play').exists())
+
+
+class RegistrationTests(TestCase):
+    
+    def test_password_longer_than_login_limit_is_rejected(self):
+        password = 'p' * (PASSWORD_MAX_LENGTH + 1)
+        response = APIClient().post('/api/auth/register/', {
+            'email': 'long@example.com', 'username': 'long',
+            'password': password, 'confirm_password': password
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(User.objects.filter(email='long@example.com').exists())
+
+
+class APITestCase(TestCase):
+    """Two linked partners and one activity; Celery tasks run inline"""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._eager = celery_app.conf.task_always_eager
+        celery_app.conf.task_always_eager = True
+    
+    @classmethod
+    def tearDownClass(cls):
+        celery_app.conf.task_always_eager = cls._eager
+        super().tearDownClass()
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='asha@example.com', username='asha', password='pw')
+        cls.partner = User.objects.create_user(email='ravi@example.com', username='ravi', password='pw')
+        User.objects.filter(pk=cls.user.pk).update(partner=cls.partner)
+        User.objects.filter(pk=cls.partner.pk).update(partner=cls.user)
+        cls.category = ActivityCategory.objects.create(
+            name_en='Talk', name_hi='बात', description_en='Talk', description_hi='बात',
+            icon='💬', color='#FFB6C1'
+        )
+        cls.activity = Activity.objects.create(
+            category=cls.category, title_en='Share a memory', title_hi='एक याद',
+            description_en='Tell each other', description_hi='एक दूसरे को बताएं',
+            instructions_en=['Sit together'], instructions_hi=['साथ बैठें'],
+            estimated_time_minutes=10, points_reward=20, coins_reward=5,
+            is_daily_featured=True
+        )
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.select_related('partner').get(pk=self.user.pk))
+    
+    def complete(self, **body):
+        session = ActivitySession.objects.create(user=self.user, activity=self.activity)
+        return self.client.post(
+            f'/api/activities/{self.activity.pk}/complete/',
+            {'session_id': str(session.pk), **body}, format='json'
+        )
+
+
+class ActivityListTests(APITestCase):
+
+    def test_list_renders_average_rating(self):
+        response = self.client.get('/api/activities/')
+        self.assertEqual(response.status_code, 200)
+        row = response.json()['activities'][0]
+        self.assertEqual(row['title'], 'Share a memory')
+        self.assertEqual(row['average_rating'], '0.00')
+        self.assertNotIn('instructions', row)
+    
+    def test_daily_and_detail(self):
+        response = self.client.get('/api/activities/daily/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['activities'][0]['average_rating'], '0.00')
+        
+        response = self.client.get(f'/api/activities/{self.activity.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['activity']['instructions'], ['Sit together'])
+    
+    def test_start(self):
+        response = self.client.post(f'/api/activities/{self.activity.pk}/start/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['session']['activity']['average_rating'], '0.00')
+
+
+class CompletionTests(APITestCase):
+
+    def test_complete_credits_user_activity_and_streak(self):
+        response = self.complete(rating=4)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['rewards']['new_total_points'], 20)
+        self.assertEqual(body['rewards']['new_total_coins'], 5)
+        
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual((user.total_points, user.coins, user.completions_count_30d), (20, 5, 1))
+        activity = Activity.objects.get(pk=self.activity.pk)
+        self.assertEqual(activity.completion_count, 1)
+        self.assertEqual(activity.average_rating, Decimal('4.00'))
+        self.assertEqual(
+            CoinTransaction.objects.filter(user=self.user, transaction_type='earned_activity').count(), 1
+        )
+        
+        streak = Streak.objects.get(user=self.user)
+        self.assertEqual((streak.current_streak, streak.longest_streak, streak.total_active_days), (1, 1, 1))
+        
+        # A second completion the same day leaves the streak alone
+        self.assertEqual(self.complete(rating=2).status_code, 200)
+        streak.refresh_from_db()
+        self.assertEqual((streak.current_streak, streak.total_active_days), (1, 1))
+        activity.refresh_from_db()
+        self.assertEqual(activity.average_rating, Decimal('3.00'))
+    
+    def test_streak_continues_from_yesterday(self):
+        yesterday = timezone.now().date() - timedelta(days=1)
+        Streak.objects.create(
+            user=self.user, current_streak=3, longest_streak=3, total_active_days=3,
+            last_activity_date=yesterday, streak_start_date=yesterday - timedelta(days=2)
+        )
+        self.assertEqual(self.complete().status_code, 200)
+        streak = Streak.objects.get(user=self.user)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (4, 4))
+        self.assertEqual(streak.streak_start_date, yesterday - timedelta(days=2))
+    
+    def test_broker_outage_does_not_fail_completion(self):
+        with mock.patch(
+            'bondingapp.core.views.notify_from_template.delay', side_effect=OperationalError
+        ) as delay, self.captureOnCommitCallbacks(execute=True):
+            response = self.complete()
+        self.assertEqual(response.status_code, 200)
+        delay.assert_called_once()
+        self.assertEqual(ActivityCompletion.objects.filter(user=self.user).count(), 1)
+    
+    def test_invalid_session(self):
+        response = self.client.post(
+            f'/api/activities/{self.activity.pk}/complete/',
+            {'session_id': '00000000-0000-0000-0000-000000000000'}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ActivityCompletion.objects.exists())
+
+
+class SkipTests(APITestCase):
+
+    def test_skip_until_limit(self):
+        url = f'/api/activities/{self.activity.pk}/skip/'
+        self.assertEqual(self.client.post(url).status_code, 200)
+        self.assertEqual(self.client.post(url).status_code, 200)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json()['skips_used'], 2)
+        
+        skip_limit = SkipLimit.objects.get(user=self.user)
+        self.assertEqual((skip_limit.skips_used, skip_limit.remaining_skips), (2, 0))
+
+
+class PartnerStatusTests(APITestCase):
+
+    def test_status(self):
+        today = timezone.now().date()
+        Streak.objects.create(
+            user=self.partner, current_streak=5, longest_streak=5, last_activity_date=today
+        )
+        ActivitySession.objects.create(user=self.partner, activity=self.activity)
+        
+        response = self.client.get('/api/partner/status/')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['partner']['id'], str(self.partner.pk))
+        self.assertEqual(body['current_streak'], 5)
+        self.assertEqual(body['current_activity'], 'Share a memory')
+        self.assertEqual(body['activities_completed_today'], 0)
+    
+    def test_today_is_the_local_day(self):
+        # 01:00 IST is still the previous day in UTC
+        now = timezone.make_aware(datetime(2026, 10, 15, 1, 0)).astimezone(dt_timezone.utc)
+        completion = ActivityCompletion.objects.create(
+            user=self.partner, activity=self.activity,
+            session=ActivitySession.objects.create(user=self.partner, activity=self.activity)
+        )
+        ActivityCompletion.objects.filter(pk=completion.pk).update(
+            completed_at=now - timedelta(minutes=30)
+        )
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            response = self.client.get('/api/partner/status/')
+        self.assertEqual(response.json()['activities_completed_today'], 1)
+    
+    def test_no_partner(self):
+        loner = User.objects.create_user(email='solo@example.com', username='solo', password='pw')
+        self.client.force_authenticate(loner)
+        response = self.client.get('/api/partner/status/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['has_partner'])
+
+
+class HistoryTests(APITestCase):
+
+    def test_history_pages_newest_first(self):
+        for _ in range(3):
+            self.assertEqual(self.complete().status_code, 200)
+        
+        response = self.client.get('/api/progress/history/?limit=2')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(len(body['history']), 2)
+        self.assertIsNotNone(body['next'])
+        self.assertEqual(body['history'][0]['activity']['average_rating'], '0.00')
+        
+        response = self.client.get(body['next'])
+        self.assertEqual(len(response.json()['history']), 1)
+    
+    def test_date_filters(self):
+        self.assertEqual(self.complete().status_code, 200)
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        
+        response = self.client.get(f'/api/progress/history/?date_from={tomorrow}')
+        self.assertEqual(response.json()['history'], [])
+        response = self.client.get(f'/api/progress/history/?date_to={timezone.localdate()}')
+        self.assertEqual(len(response.json()['history']), 1)
+    
+    def test_page_query_count_is_constant(self):
+        for _ in range(20):
+            self.assertEqual(self.complete().status_code, 200)
+        
+        # One SELECT joining activity and category, however many rows are on the page
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/progress/history/?limit=20')
+        self.assertEqual(len(response.json()['history']), 20)
+    
+    def test_invalid_dates_are_rejected(self):
+        for query in ('date_from=garbage', 'date_to=2024-02-30'):
+            response = self.client.get(f'/api/progress/history/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
 
-# Create your tests here.
+class MilestoneTests(APITestCase):
+    
+    def test_sweep_pays_each_milestone_once(self):
+        Milestone.objects.create(
+            name_en='First', name_hi='पहला', description_en='One activity', description_hi='एक',
+            icon='🎯', milestone_type='activity_count', criteria_value=1,
+            points_reward=100, coins_reward=50
+        )
+        self.assertEqual(self.complete().status_code, 200)
+        
+        self.assertEqual(award_milestones_chunk([str(self.user.pk)]), 1)
+        self.assertEqual(award_milestones_chunk([str(self.user.pk)]), 0)
+        
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual((user.total_points, user.coins), (120, 55))
+        self.assertEqual(UserMilestone.objects.filter(user=self.user).count(), 1)
+        bonus = CoinTransaction.objects.get(user=self.user, transaction_type='earned_milestone')
+        self.assertEqual(bonus.balance_after, user.coins)